@@ -2,7 +2,9 @@
 
 from typing import Dict, Any
 from agents import BaseAgent
+from utils.api_client import SHARED_ADAS_SYSTEM_PROMPT
 import json
+from utils.serialization import canonical_json
 
 class BottleneckDiagnosisAgent(BaseAgent):
     """Diagnoses technical bottlenecks in current ADAS solutions."""
@@ -99,13 +101,13 @@ Output format:
         prompt = f"""Diagnose technical bottlenecks in US ADAS semiconductor solutions.
 
 Competitive landscape insights:
-{json.dumps(competitive_data.get('solutions', [])[:3], indent=2) if competitive_data else 'Not available'}
+{canonical_json(competitive_data.get('solutions', [])[:3], indent=2) if competitive_data else 'Not available'}
 
 Known pain points:
-{json.dumps(pain_points.get('pain_points', [])[:3], indent=2) if pain_points else 'Not available'}
+{canonical_json(pain_points.get('pain_points', [])[:3], indent=2) if pain_points else 'Not available'}
 
 Ideal requirements:
-{json.dumps(architecture, indent=2)[:500] if architecture else 'Not available'}
+{canonical_json(architecture, indent=2)[:500] if architecture else 'Not available'}
 
 Focus on:
 1. Bottlenecks preventing L2+ to L3 transition
@@ -120,7 +122,8 @@ Identify root causes and explain why current approaches fall short."""
             response = await self.api_client.send_message(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                max_tokens=4096,
+                cached_system=SHARED_ADAS_SYSTEM_PROMPT
             )
             
             result = self._parse_bottleneck_data(response)
@@ -2,6 +2,7 @@
 
 from typing import Dict, Any
 from agents import BaseAgent
+from utils.api_client import SHARED_ADAS_SYSTEM_PROMPT
 import json
 # import os  <-- REMOVED: not needed in agent anymore
 
@@ -98,7 +99,8 @@ Provide comprehensive competitive intelligence."""
             response = await self.api_client.send_message(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                max_tokens=4096,
+                cached_system=SHARED_ADAS_SYSTEM_PROMPT
             )
             
             result = self._parse_competitive_data(response)
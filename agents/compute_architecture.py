@@ -2,7 +2,9 @@
 
 from typing import Dict, Any
 from agents import BaseAgent
+from utils.api_client import SHARED_ADAS_SYSTEM_PROMPT
 import json
+from utils.serialization import canonical_json
 
 class ComputeArchitectureAgent(BaseAgent):
     """Analyzes ideal compute and architecture requirements for ADAS."""
@@ -108,8 +110,8 @@ Output format:
         prompt = f"""Define ideal processing requirements for US ADAS semiconductors.
 
 Context from previous analysis:
-Trends: {json.dumps(trends_data.get('trends', [])[:3], indent=2) if trends_data else 'Not available'}
-Pain Points: {json.dumps(pain_points.get('pain_points', [])[:3], indent=2) if pain_points else 'Not available'}
+Trends: {canonical_json(trends_data.get('trends', [])[:3], indent=2) if trends_data else 'Not available'}
+Pain Points: {canonical_json(pain_points.get('pain_points', [])[:3], indent=2) if pain_points else 'Not available'}
 
 Focus on L2+ and L3 ADAS requirements for:
 - Multi-camera systems (4-8 cameras)
@@ -123,7 +125,8 @@ Provide realistic, achievable requirements based on current technology trends.""
             response = await self.api_client.send_message(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                max_tokens=4096,
+                cached_system=SHARED_ADAS_SYSTEM_PROMPT
             )
             
             result = self._parse_architecture_data(response)
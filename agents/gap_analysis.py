@@ -2,7 +2,9 @@
 
 from typing import Dict, Any
 from agents import BaseAgent
+from utils.api_client import SHARED_ADAS_SYSTEM_PROMPT
 import json
+from utils.serialization import canonical_json
 
 class GapAnalysisAgent(BaseAgent):
     """Identifies gaps and surfaces product opportunities."""
@@ -106,13 +108,13 @@ Market Context:
 - Key Segments: Camera, Radar, Sensor Fusion/AI Compute
 
 Trends Identified:
-{json.dumps(trends_data.get('trends', [])[:5], indent=2) if trends_data else 'No trends data available'}
+{canonical_json(trends_data.get('trends', [])[:5], indent=2) if trends_data else 'No trends data available'}
 
 Pain Points:
-{json.dumps(pain_points.get('pain_points', [])[:5], indent=2) if pain_points else 'No pain point data available'}
+{canonical_json(pain_points.get('pain_points', [])[:5], indent=2) if pain_points else 'No pain point data available'}
 
 Technical Bottlenecks:
-{json.dumps(bottlenecks.get('bottlenecks', [])[:3], indent=2) if bottlenecks else 'No bottleneck data available'}
+{canonical_json(bottlenecks.get('bottlenecks', [])[:3], indent=2) if bottlenecks else 'No bottleneck data available'}
 
 Focus on opportunities where:
 1. Customer pain is validated
@@ -126,7 +128,8 @@ Provide realistic, evidence-based analysis."""
             response = await self.api_client.send_message(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                max_tokens=4096,
+                cached_system=SHARED_ADAS_SYSTEM_PROMPT
             )
             
             result = self._parse_gap_data(response)
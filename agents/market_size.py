@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, List
 from agents import BaseAgent 
+from utils.api_client import SHARED_ADAS_SYSTEM_PROMPT
 import logging 
 
 class MarketSizeAgent(BaseAgent):
@@ -77,7 +78,8 @@ Provide comprehensive market sizing with all required fields."""
             response = await self.api_client.send_message(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                max_tokens=4096,
+                cached_system=SHARED_ADAS_SYSTEM_PROMPT
             )
             
             # Parse and validate response
@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, Optional
 from agents import BaseAgent
+from utils.api_client import SHARED_ADAS_SYSTEM_PROMPT
 import json
 
 class PainPointExtractionAgent(BaseAgent):
@@ -124,7 +125,8 @@ Output format:
             response = await self.api_client.send_message(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                max_tokens=4096,
+                cached_system=SHARED_ADAS_SYSTEM_PROMPT
             )
             
             result = self._parse_pain_point_data(response)
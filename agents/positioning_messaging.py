@@ -2,7 +2,9 @@
 
 from typing import Dict, Any
 from agents import BaseAgent
+from utils.api_client import SHARED_ADAS_SYSTEM_PROMPT
 import json
+from utils.serialization import canonical_json
 
 class PositioningMessagingAgent(BaseAgent):
     """Creates positioning and messaging for identified opportunities."""
@@ -131,7 +133,7 @@ Output format:
         
         prompt = f"""Create positioning and messaging for these ADAS semiconductor opportunities:
 
-{json.dumps(opportunities, indent=2)}
+{canonical_json(opportunities, indent=2)}
 
 Requirements:
 1. Focus on top 3 opportunities
@@ -146,7 +148,8 @@ Develop compelling go-to-market positioning."""
             response = await self.api_client.send_message(
                 prompt=prompt,
                 system_prompt=system_prompt,
-                max_tokens=4096
+                max_tokens=4096,
+                cached_system=SHARED_ADAS_SYSTEM_PROMPT
             )
             
             result = self._parse_positioning_data(response)
@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, Optional
 from agents import BaseAgent 
+from utils.api_client import SHARED_ADAS_SYSTEM_PROMPT
 from utils.api_clients.uspto_client import USPTOClien
 
 class TrendsSimplificationAgent(BaseAgent):
@@ -105,7 +106,8 @@ Output format:
         try:
             response = await self.api_client.send_message(
                 prompt=prompt,
-                system_prompt=system_prompt
+                system_prompt=system_prompt,
+                cached_system=SHARED_ADAS_SYSTEM_PROMPT
             )
             
             result = self._parse_trends_data(response)
@@ -2,11 +2,14 @@
 
 import streamlit as st
 import json
+import orjson
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from string import Template
 
 # Page configuration
 st.set_page_config(
@@ -56,24 +59,6 @@ st.markdown("""
         display: inline-block;
         margin: 0 4px;
     }
-    .assumption-box {
-        background-color: #fff3cd;
-        border-left: 4px solid #ffc107;
-        padding: 12px;
-        margin: 8px 0;
-        border-radius: 4px;
-    }
-    .evidence-box {
-        background-color: #e8f5e9;
-        border-left: 4px solid #4caf50;
-        padding: 12px;
-        margin: 8px 0;
-        border-radius: 4px;
-    }
-    .section-divider {
-        border-top: 2px solid #e0e0e0;
-        margin: 2rem 0;
-    }
     .python-viz-footer {
         background-color: #f5f5f5;
         border-top: 1px solid #e0e0e0;
@@ -91,39 +76,151 @@ st.markdown("""
         margin: 8px 0;
         border-radius: 4px;
     }
+    .kpi-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
+        gap: 8px;
+        margin: 8px 0;
+    }
+    .kpi-grid .kpi {
+        background-color: #f8f9fa;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        padding: 10px 12px;
+    }
+    .kpi-grid .label {
+        font-size: 0.8rem;
+        color: #666;
+    }
+    .kpi-grid .value {
+        font-size: 1.05rem;
+        font-weight: 600;
+    }
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_latest_results():
-    """Load the most recent analysis results from individual agent files."""
+# Static lookup maps and badge HTML, built once at import instead of
+# being reallocated on every rerun
+_CONFIDENCE_STYLE = {
+    'High': ('🟢', 'green'),
+    'Medium': ('🟡', 'orange'),
+    'Low': ('🔴', 'red'),
+    'Unknown': ('⚪', 'gray')
+}
+_SOURCE_BADGE_HTML = '<span class="source-badge">From Research Sources</span>'
+_AI_BADGE_HTML = '<span class="ai-badge">AI Analysis (Claude Sonnet 4.5)</span>'
+
+# Precompiled HTML skeletons: substitute() in the per-item loops avoids
+# rebuilding the same f-string skeleton on every iteration
+_BADGE_TMPL = Template('<span class="$cls">$label</span>')
+
+# Page-level attribution badges, substituted once at import and shared
+# by reference thereafter
+_FINANCIAL_BADGE_HTML = _BADGE_TMPL.substitute(
+    cls='source-badge', label='Based on Financial Research Sources')
+_RESEARCH_BADGE_HTML = _BADGE_TMPL.substitute(
+    cls='source-badge', label='Research Sources')
+_INDUSTRY_BADGE_HTML = _BADGE_TMPL.substitute(
+    cls='source-badge', label='From Industry Reports & Stakeholder Statements')
+_VENDOR_BADGE_HTML = _BADGE_TMPL.substitute(
+    cls='source-badge', label='From Vendor Specifications')
+_SYNTH_BADGE_HTML = _BADGE_TMPL.substitute(
+    cls='ai-badge', label='AI-Synthesized from All Previous Agents (Claude Sonnet 4.5)')
+_GTM_BADGE_HTML = _BADGE_TMPL.substitute(
+    cls='ai-badge', label='AI-Generated Go-to-Market Strategy (Claude Sonnet 4.5)')
+
+# Per-item style lookups hoisted out of the render loops
+_VELOCITY_COLORS = {
+    'accelerating': 'green',
+    'steady': 'blue',
+    'maturing': 'orange',
+    'declining': 'red'
+}
+_SEVERITY_INDICATOR = {'High': ':red[●]', 'Medium': ':orange[●]', 'Low': ':green[●]'}
+_RISK_COLORS = {'High': 'red', 'Medium': 'orange', 'Low': 'green'}
+
+# Shared fallback for missing sub-dicts; avoids allocating a fresh {} on
+# every .get(..., {}) miss
+_EMPTY: dict = {}
+_API_STATUS_TMPL = Template(
+    '<div class="api-status-box"><strong>$title</strong><br>$body</div>')
+
+# Memoized result of the last directory scan; the reports directory
+# mtime only changes when files are added/removed, so an unchanged
+# mtime means the previous scan result is still valid
+_LAST_SCAN = {'dir_mtime': None, 'result': (None, None, 0)}
+
+def _read_manifest(reports_dir):
+    """Read the latest.json manifest written by the runner, or None."""
+    try:
+        return orjson.loads((reports_dir / "latest.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+
+def _scan_latest_timestamp():
+    """Find the latest run timestamp and summary file (cheap, uncached).
+
+    Skips the glob entirely when the reports directory mtime has not
+    changed since the previous scan, so a no-new-results rerun costs a
+    single stat() call.
+
+    Returns:
+        (timestamp, summary_path, summary_mtime) or (None, None, 0) if no results
+    """
     reports_dir = Path("outputs/reports")
-    
+
     if not reports_dir.exists():
-        return {}
-    
+        return None, None, 0
+
+    dir_mtime = reports_dir.stat().st_mtime
+    if dir_mtime == _LAST_SCAN['dir_mtime']:
+        return _LAST_SCAN['result']
+
+    # Fast path: the runner writes a latest.json manifest pointing at the
+    # current run, which saves the directory glob entirely
+    manifest = _read_manifest(reports_dir)
+    if manifest:
+        summary_path = reports_dir / manifest.get('summary_file', '')
+        if summary_path.exists():
+            result = (manifest['timestamp'], summary_path, summary_path.stat().st_mtime)
+            _LAST_SCAN['dir_mtime'] = dir_mtime
+            _LAST_SCAN['result'] = result
+            return result
+
     # Find the latest execution summary to get timestamp
     summaries = sorted(reports_dir.glob("execution_summary_*.json"))
-    
+
     if not summaries:
         # Fallback: find timestamp from any result file
         all_results = sorted(reports_dir.glob("*_result_*.json"))
         if not all_results:
-            return {}
-        
-        # Extract timestamp from filename: agent_result_YYYYMMDD_HHMMSS.json
-        filename_parts = all_results[-1].stem.split('_')
-        timestamp = f"{filename_parts[-2]}_{filename_parts[-1]}"
+            result = (None, None, 0)
+        else:
+            # Extract timestamp from filename: agent_result_YYYYMMDD_HHMMSS.json
+            filename_parts = all_results[-1].stem.split('_')
+            timestamp = f"{filename_parts[-2]}_{filename_parts[-1]}"
+            result = (timestamp, None, all_results[-1].stat().st_mtime)
     else:
-        with open(summaries[-1], 'r') as f:
-            summary_data = json.load(f)
-        
         # Extract timestamp from summary filename
         filename_parts = summaries[-1].stem.split('_')
         timestamp = f"{filename_parts[-2]}_{filename_parts[-1]}"
-    
-    print(f"Looking for results with timestamp: {timestamp}")
-    
+        result = (timestamp, summaries[-1], summaries[-1].stat().st_mtime)
+
+    _LAST_SCAN['dir_mtime'] = dir_mtime
+    _LAST_SCAN['result'] = result
+    return result
+
+@st.cache_data(ttl=300, persist="disk", show_spinner=False)
+def _load_for(timestamp, summary_mtime):
+    """Load all agent results for a run (cached; summary_mtime busts the cache
+    when a new analysis run writes new files).
+
+    persist="disk" lets cold-started workers deserialize the cached payload
+    instead of re-reading and re-parsing all 10 agent result files; the TTL
+    bounds staleness if the mtime key ever misses a change.
+    """
+    reports_dir = Path("outputs/reports")
+
     # Load individual agent results
     agent_names = [
         'source_discovery',
@@ -137,45 +234,54 @@ def load_latest_results():
         'positioning_messaging',
         'visualization_reporting'
     ]
-    
-    results = {}
+
+    # Resolve filepaths first (cheap), then read + parse concurrently:
+    # the GIL is released during read_bytes() and orjson parses are short
+    pairs = []
     for agent_name in agent_names:
         # Try with _result_ pattern
         filepath = reports_dir / f"{agent_name}_result_{timestamp}.json"
-        
+
         # Fallback: try without _result_
         if not filepath.exists():
             filepath = reports_dir / f"{agent_name}_{timestamp}.json"
-        
+
         # Fallback: find any file with this agent name
         if not filepath.exists():
             matching_files = sorted(reports_dir.glob(f"{agent_name}*.json"))
             if matching_files:
                 filepath = matching_files[-1]
-        
+
         if filepath.exists():
-            try:
-                with open(filepath, 'r') as f:
-                    results[agent_name] = json.load(f)
-                print(f"Loaded: {filepath.name}")
-            except Exception as e:
-                print(f"Error loading {filepath.name}: {e}")
-        else:
-            print(f"Not found: {agent_name}")
-    
+            pairs.append((agent_name, filepath))
+
+    def _read_one(path):
+        try:
+            return orjson.loads(path.read_bytes())
+        except Exception:
+            return None
+
+    results = {}
+    if pairs:
+        with ThreadPoolExecutor(max_workers=min(10, len(pairs))) as ex:
+            for (agent_name, _), loaded in zip(pairs, ex.map(_read_one, (p for _, p in pairs))):
+                if loaded is not None:
+                    results[agent_name] = loaded
+
     # Load execution summary if available
     metadata = {}
     execution_log = []
-    
+
+    summaries = sorted(reports_dir.glob(f"execution_summary_{timestamp}.json"))
     if summaries:
         try:
             with open(summaries[-1], 'r') as f:
                 summary = json.load(f)
                 metadata = summary.get('metadata', {})
                 execution_log = summary.get('execution_log', [])
-        except Exception as e:
-            print(f"Error loading summary: {e}")
-    
+        except Exception:
+            pass
+
     return {
         'results': results,
         'metadata': metadata,
@@ -183,6 +289,75 @@ def load_latest_results():
         'timestamp': timestamp
     }
 
+def load_latest_results():
+    """Load the most recent analysis results from individual agent files."""
+    timestamp, _summary_path, summary_mtime = _scan_latest_timestamp()
+
+    if timestamp is None:
+        return {}
+
+    return _load_for(timestamp, summary_mtime)
+
+@st.cache_data(show_spinner=False)
+def _filter_frames(timestamp, _results):
+    """Build categorical filter frames for pain points and solutions, once per run.
+
+    The timestamp is the cache key; _results is skipped by the cache hasher.
+    """
+    frames = {}
+
+    pain_points = _results.get('pain_point_extraction', {}).get('pain_points', [])
+    if pain_points:
+        frames['pain_points'] = pd.DataFrame(pain_points).astype(
+            {'category': 'category', 'severity': 'category'})
+
+    solutions = _results.get('competitive_landscape', {}).get('solutions', [])
+    if solutions:
+        frames['solutions'] = pd.json_normalize(solutions).astype(
+            {'category': 'category', 'market_position': 'category'})
+
+    return frames
+
+@st.cache_data(show_spinner=False)
+def build_assumptions_table(timestamp, _results):
+    """Collect assumptions from all agents, once per run.
+
+    The timestamp is the cache key; _results is skipped by the cache hasher.
+    """
+    all_assumptions = []
+
+    # From Gap Analysis
+    if 'gap_analysis' in _results:
+        gap_assumptions = _results['gap_analysis'].get('assumptions', [])
+        for assumption in gap_assumptions:
+            all_assumptions.append({
+                'Agent': 'Gap Analysis',
+                'Assumption': assumption.get('assumption', 'N/A'),
+                'Risk if Wrong': assumption.get('risk_if_wrong', 'N/A'),
+                'Validation Signal': assumption.get('validation_signal', 'N/A'),
+                'Type': 'Explicit'
+            })
+
+    return all_assumptions
+
+@st.cache_data(show_spinner=False)
+def build_opps_comparison_df(timestamp, _opportunities):
+    """Build the opportunity comparison matrix frame, once per run."""
+    pairs = [(opp, opp.get('market_size') or _EMPTY, opp.get('execution') or _EMPTY)
+             for opp in _opportunities]
+
+    return pd.DataFrame.from_records(
+        ((opp['rank'],
+          opp['name'][:50] + '...' if len(opp['name']) > 50 else opp['name'],
+          market.get('addressable_market_usd_millions', 0),
+          market.get('revenue_potential_range_usd_millions', 'N/A'),
+          execution.get('time_to_market_months_range', 'N/A'),
+          execution.get('estimated_roi_range', 'N/A'),
+          execution.get('risk_level', 'Unknown'))
+         for opp, market, execution in pairs),
+        columns=['Rank', 'Opportunity', 'Market ($M)', 'Revenue ($M)',
+                 'Time (mo)', 'ROI', 'Risk'])
+
 def show_api_data_sources(data_sources):
     """Show which APIs were used to enhance the data"""
     if not data_sources:
@@ -213,26 +388,822 @@ def show_attribution(item, field_name="data"):
     """Show whether data is from a source or AI-derived."""
     if isinstance(item, dict):
         if 'source' in item or 'sources' in item or 'evidence' in item:
-            st.markdown(f'<span class="source-badge">From Research Sources</span>', unsafe_allow_html=True)
+            st.markdown(_SOURCE_BADGE_HTML, unsafe_allow_html=True)
         else:
-            st.markdown(f'<span class="ai-badge">AI Analysis (Claude Sonnet 4.5)</span>', unsafe_allow_html=True)
+            st.markdown(_AI_BADGE_HTML, unsafe_allow_html=True)
+
+@lru_cache(maxsize=64)
+def _confidence_markdown(confidence):
+    """Build the confidence-level markdown once per distinct value."""
+    emoji, color = _CONFIDENCE_STYLE.get(confidence, _CONFIDENCE_STYLE['Unknown'])
+    return f"**Confidence Level:** {emoji} :{color}[{confidence}]"
 
 def show_confidence(confidence, rationale):
     """Display confidence level with rationale."""
-    color_map = {
-        'High': 'green',
-        'Medium': 'orange',
-        'Low': 'red',
-        'Unknown': 'gray'
-    }
-    
-    color = color_map.get(confidence, 'gray')
-    st.markdown(f"**Confidence Level:** :{color}[{confidence}]")
-    
+    st.markdown(_confidence_markdown(confidence))
+
     if rationale:
         with st.expander("View Confidence Rationale"):
             st.markdown(rationale)
 
+@st.fragment
+def _render_executive(results, metadata, execution_log):
+    """Render the Executive Summary page."""
+    st.header("Executive Summary")
+    
+    # Show API enhancement status
+    apis_available = metadata.get('apis_available', {})
+    if any(apis_available.values()):
+        parts = ['<div class="api-status-box">', "**Data Enhanced With:**"]
+        if apis_available.get('uspto'):
+            parts.append("- USPTO Patent Database (innovation trends, filing velocity)")
+        if apis_available.get('github'):
+            parts.append("- GitHub Developer Feedback (real pain points from ADAS projects)")
+        if apis_available.get('semantic_scholar'):
+            parts.append("- Semantic Scholar (academic research validation)")
+        parts.append('</div>')
+        st.markdown("\n".join(parts), unsafe_allow_html=True)
+    
+    # Quick metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    market_data = results.get('market_size', {})
+    gap_data = results.get('gap_analysis', {})
+
+    # Unpack once; these feed several widgets on every rerun
+    cur = market_data.get('current_market_size_usd_millions', 0)
+    proj = market_data.get('projected_market_size_usd_millions', 0)
+    cagr = market_data.get('cagr_percent', 0)
+    base = market_data.get('base_year', 'N/A')
+
+    with col1:
+        st.metric("Current Market", f"${cur:,}M", f"{base}")
+    
+    with col2:
+        st.metric("2030 Projection", f"${proj:,}M", f"+{cagr}%")
+    
+    with col3:
+        opportunities = gap_data.get('opportunities', [])
+        st.metric("Opportunities", len(opportunities))
+    
+    with col4:
+        trends_data = results.get('trends_simplification', {})
+        trends = trends_data.get('trends', [])
+        st.metric("Key Trends", len(trends))
+    
+    # Top insights
+    st.markdown("### Key Insights")
+    
+    if opportunities:
+        top_opp = opportunities[0]
+        market_size = top_opp.get('market_size', {})
+        
+        with st.container(border=True):
+            st.markdown(
+                f"**Top Opportunity:** {top_opp.get('name', 'Unknown')}  \n"
+                f"**Market Size:** ${market_size.get('addressable_market_usd_millions', 0)}M  \n"
+                f"**Revenue Potential:** {market_size.get('revenue_potential_range_usd_millions', 'N/A')}  \n"
+                f"**Risk Level:** {top_opp.get('execution', {}).get('risk_level', 'Unknown')}"
+            )
+    
+    # Agent execution status
+    st.markdown("### Analysis Execution Timeline")
+    
+    if execution_log:
+        df = pd.DataFrame(execution_log)
+        timeline_df = df.assign(
+            Agent=df['agent'].str.replace('_', ' ', regex=False).str.title(),
+            Status=np.where(df['success'], 'Success', 'Failed'),
+            Confidence=df.get('confidence', 'Unknown'),
+            Time=pd.to_datetime(df['timestamp']).dt.strftime("%H:%M:%S"),
+            **{'APIs Used': df.get('data_sources', pd.Series([{}] * len(df))).map(
+                lambda ds: ', '.join(
+                    k.replace('_data', '').upper()
+                    for k, v in (ds if isinstance(ds, dict) else {}).items()
+                    if 'api' in str(v)
+                ) or 'None'
+            )}
+        )[['Agent', 'Status', 'Confidence', 'Time', 'APIs Used']]
+        st.dataframe(timeline_df, use_container_width=True, hide_index=True)
+
+@st.fragment
+def _render_market_size(results):
+    """Render the Market Size Analysis page."""
+    # Lazy import: plotly is heavy (~200ms) and only chart pages need it
+    import plotly.graph_objects as go
+
+    st.header("Market Size Analysis")
+    
+    if 'market_size' not in results:
+        st.warning("Market Size data not available")
+        return
+    
+    market_data = results['market_size']
+    
+    # Attribution
+    st.markdown(_FINANCIAL_BADGE_HTML, unsafe_allow_html=True)
+    
+    # Key metrics
+    col1, col2, col3 = st.columns(3)
+    
+    cur = market_data.get('current_market_size_usd_millions', 0)
+    proj = market_data.get('projected_market_size_usd_millions', 0)
+    cagr = market_data.get('cagr_percent', 0)
+
+    with col1:
+        st.metric("Current Market", f"${cur:,}M",
+                 f"Base: {market_data.get('base_year', 'N/A')}")
+    
+    with col2:
+        st.metric("2030 Projection", f"${proj:,}M",
+                 f"Year: {market_data.get('projection_year', 'N/A')}")
+    
+    with col3:
+        st.metric("CAGR", f"{cagr}%")
+    
+    # Market growth chart
+    st.markdown("### Market Growth Projection")
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=['Current (2023)', 'Projected (2030)'],
+        y=[cur, proj],
+        marker_color=['#1f77b4', '#2ecc71'],
+        text=[f"${cur}M", f"${proj}M"],
+        textposition='auto'
+    ))
+    
+    fig.update_layout(
+        title=f"US ADAS Semiconductor Market ({cagr}% CAGR)",
+        yaxis_title="Market Size (USD Millions)",
+        height=400
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    show_python_viz_attribution()
+    
+    # Segment breakdown
+    st.markdown("### Market Breakdown by Segment")
+    
+    breakdown = market_data.get('breakdown', {})
+    if breakdown:
+        # from_records with typed columns keeps Percentage numeric (sortable);
+        # the Styler formats it once, vectorized
+        segment_df = pd.DataFrame.from_records([
+            ('Camera',
+             breakdown['camera']['size_usd_millions'],
+             breakdown['camera']['percentage'] / 100),
+            ('Radar',
+             breakdown['radar']['size_usd_millions'],
+             breakdown['radar']['percentage'] / 100),
+            ('Sensor Fusion/Compute',
+             breakdown['sensor_fusion_compute']['size_usd_millions'],
+             breakdown['sensor_fusion_compute']['percentage'] / 100)
+        ], columns=['Segment', 'Size ($M)', 'Percentage'])
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.dataframe(segment_df.style.format({'Percentage': '{:.0%}'}),
+                         use_container_width=True, hide_index=True)
+        
+        with col2:
+            fig = go.Figure(data=[go.Pie(
+                labels=['Camera', 'Radar', 'Sensor Fusion/Compute'],
+                values=[
+                    breakdown['camera']['size_usd_millions'],
+                    breakdown['radar']['size_usd_millions'],
+                    breakdown['sensor_fusion_compute']['size_usd_millions']
+                ],
+                hole=0.3
+            )])
+            fig.update_layout(title="Market Breakdown (2023)", height=400)
+            st.plotly_chart(fig, use_container_width=True)
+            show_python_viz_attribution()
+    
+    # Data sources
+    st.markdown("### Primary Data Sources")
+    st.markdown(_RESEARCH_BADGE_HTML, unsafe_allow_html=True)
+    
+    for source in market_data.get('sources', []):
+        with st.expander(f"**{source.get('name', 'Unknown')}** ({source.get('year', 'N/A')})"):
+            st.markdown(f"**Finding:** {source.get('figure', 'N/A')}")
+            if source.get('url'):
+                st.markdown(f"**URL:** {source.get('url', 'N/A')}")
+    
+    # Confidence
+    st.markdown("---")
+    show_confidence(market_data.get('confidence', 'Unknown'),
+                   market_data.get('confidence_rationale', ''))
+
+@st.fragment
+def _render_trends(results):
+    """Render the Technology Trends Analysis page."""
+    st.header("Technology Trends Analysis")
+    
+    if 'trends_simplification' not in results:
+        st.warning("Trends data not available")
+        return
+    
+    trends_data = results['trends_simplification']
+    trends = trends_data.get('trends', [])
+    
+    # Show data sources
+    data_sources = trends_data.get('data_sources', {})
+    st.markdown(_AI_BADGE_HTML, unsafe_allow_html=True)
+    show_api_data_sources(data_sources)
+    
+    # Patent insights if available
+    patent_insights = trends_data.get('patent_insights', {})
+    if patent_insights.get('data_available'):
+        st.markdown(_API_STATUS_TMPL.substitute(
+            title='Enhanced with USPTO Patent Data:',
+            body=(f"- Patent Filing Analysis: {', '.join(patent_insights.get('top_innovators', [])[:3])} leading innovation<br>"
+                  f"- Emerging Technologies Identified: {len(patent_insights.get('emerging_technologies', []))} areas with rapid patent growth")
+        ), unsafe_allow_html=True)
+    
+    st.metric("Trends Identified", len(trends))
+    
+    # Timeline filter
+    timelines = sorted(set(t.get('timeline', 'Unknown') for t in trends))
+    selected_timeline = st.selectbox("Filter by Timeline", ['All'] + timelines)
+    
+    filtered_trends = trends if selected_timeline == 'All' else [
+        t for t in trends if t.get('timeline') == selected_timeline
+    ]
+    
+    # Display trends
+    for i, trend in enumerate(filtered_trends, 1):
+        st.markdown(f"### {i}. {trend.get('name', 'Unknown')}")
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            st.markdown(f"**Description:** {trend.get('description', 'N/A')}")
+            st.markdown(f"**Silicon Implication:** {trend.get('silicon_implication', 'N/A')}")
+            
+            # Show innovation velocity if available (from USPTO data)
+            if trend.get('innovation_velocity'):
+                velocity = trend['innovation_velocity']
+                color = _VELOCITY_COLORS.get(velocity, 'gray')
+                st.markdown(f"**Innovation Velocity:** :{color}[{velocity.title()}]")
+        
+        with col2:
+            st.metric("Timeline", trend.get('timeline', 'Unknown'))
+        
+        # Evidence
+        evidence = trend.get('evidence', {})
+        if evidence:
+            evidence_type = evidence.get('type', 'Unknown')
+            badge_type = "api-badge" if evidence_type == "patent_data" else "source-badge"
+            
+            with st.container(border=True):
+                st.markdown(_BADGE_TMPL.substitute(
+                    cls=badge_type, label=evidence_type.replace('_', ' ').title()),
+                    unsafe_allow_html=True)
+                parts = [f"**Source:** {evidence.get('source', 'Unknown')}",
+                         f"**Evidence:** {evidence.get('key_quote', 'N/A')}"]
+
+                # Add patent filing data if available
+                if evidence.get('patent_filings'):
+                    parts.append(f"**Patent Activity:** {evidence['patent_filings']}")
+
+                st.markdown("  \n".join(parts))
+        
+        st.divider()
+    
+    # Acronyms
+    st.markdown("### Acronyms & Definitions")
+    acronyms = trends_data.get('acronyms_defined', {})
+    
+    if acronyms:
+        acro_df = pd.DataFrame.from_records(
+            list(acronyms.items()), columns=['Acronym', 'Definition'])
+        st.dataframe(acro_df, use_container_width=True, hide_index=True)
+    
+    # Confidence
+    st.markdown("---")
+    show_confidence(trends_data.get('confidence', 'Unknown'),
+                   trends_data.get('confidence_rationale', ''))
+
+@st.fragment
+def _render_pain_points(results):
+    """Render the Market Pain Points Analysis page."""
+    import plotly.express as px
+
+    st.header("Market Pain Points Analysis")
+    
+    if 'pain_point_extraction' not in results:
+        st.warning("Pain Points data not available")
+        return
+    
+    pain_data = results['pain_point_extraction']
+    pain_points = pain_data.get('pain_points', [])
+    summary = pain_data.get('summary', {})
+    
+    # Show data sources
+    data_sources = pain_data.get('data_sources', {})
+    st.markdown(_INDUSTRY_BADGE_HTML, unsafe_allow_html=True)
+    show_api_data_sources(data_sources)
+    
+    # GitHub insights if available
+    github_insights = pain_data.get('github_insights', {})
+    if github_insights.get('data_available'):
+        st.markdown(_API_STATUS_TMPL.substitute(
+            title='Enhanced with GitHub Developer Feedback:',
+            body=(f"- Analyzed {github_insights.get('total_issues_analyzed', 0)} real issues from: {', '.join(github_insights.get('repos_analyzed', []))}<br>"
+                  "- Top developer complaints validated with actual bug reports and feature requests")
+        ), unsafe_allow_html=True)
+    
+    # Summary
+    col1, col2, col3, col4 = st.columns(4)
+    
+    by_category = summary.get('by_category', {})
+    
+    with col1:
+        st.metric("Total Pain Points", summary.get('total_pain_points', 0))
+    
+    with col2:
+        st.metric("Technical", by_category.get('technical', 0))
+    
+    with col3:
+        st.metric("Business", by_category.get('business', 0))
+    
+    with col4:
+        st.metric("Operational", by_category.get('operational', 0))
+    
+    # Top 3 critical
+    st.markdown("### Top 3 Critical Pain Points")
+    st.markdown("\n".join(f"- **{point}**" for point in summary.get('top_3_critical', [])))
+    
+    # Filters
+    st.markdown("### All Pain Points")
+    
+    pain_df = _filter_frames(_scan_latest_timestamp()[0], results).get('pain_points')
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        categories = pain_df['category'].cat.categories.tolist() if pain_df is not None else []
+        category_filter = st.selectbox("Filter by Category", ['All'] + categories)
+
+    with col2:
+        severities = ['All', 'High', 'Medium', 'Low']
+        severity_filter = st.selectbox("Filter by Severity", severities)
+
+    filtered_points = pain_points
+    if pain_df is not None:
+        mask = pd.Series(True, index=pain_df.index)
+        if category_filter != 'All':
+            mask &= pain_df['category'] == category_filter
+        if severity_filter != 'All':
+            mask &= pain_df['severity'] == severity_filter
+        filtered_points = [pain_points[i] for i in pain_df.index[mask]]
+    
+    # Compact view: one Arrow-serialized dataframe instead of N expanders
+    compact = st.toggle("Compact table", help="Show pain points as a single table instead of expanders")
+
+    if compact and pain_df is not None:
+        st.dataframe(
+            pain_df.loc[mask].reindex(
+                columns=['title', 'category', 'severity', 'description', 'impact']),
+            use_container_width=True, hide_index=True)
+        filtered_points = []
+
+    # Display pain points
+    for pain in filtered_points:
+        severity = pain.get('severity', 'Unknown')
+        indicator = _SEVERITY_INDICATOR.get(severity, ':gray[●]')
+        
+        with st.expander(f"{indicator} **{pain.get('title', 'Unknown')}**"):
+            st.markdown(f"**Category:** {pain.get('category', 'N/A')}")
+            st.markdown(f"**Severity:** {severity}")
+            
+            st.markdown(f"**Description:** {pain.get('description', 'N/A')}")
+            st.markdown(f"**Impact:** {pain.get('impact', 'N/A')}")
+            
+            st.markdown("**Impacted Stakeholders:**\n" + "\n".join(
+                f"- {s}" for s in pain.get('impacted_stakeholders', [])))
+            
+            # Evidence
+            evidence = pain.get('evidence', {})
+            if evidence:
+                evidence_type = evidence.get('source_type', 'Unknown')
+                badge_type = "api-badge" if evidence_type == "github_issues" else "source-badge"
+                
+                with st.container(border=True):
+                    st.markdown(_BADGE_TMPL.substitute(
+                        cls=badge_type, label=evidence_type.replace('_', ' ').title()),
+                        unsafe_allow_html=True)
+                    parts = [f"**Source:** {evidence.get('source_name', 'Unknown')}",
+                             f"**Evidence:** {evidence.get('key_quote', 'N/A')}"]
+
+                    # Add GitHub-specific data if available
+                    if evidence.get('github_issue_count'):
+                        parts.append(f"**Related GitHub Issues:** {evidence['github_issue_count']}")
+                        parts.append(f"**Developer Priority:** {evidence.get('developer_priority', 'Unknown')}")
+
+                    st.markdown("  \n".join(parts))
+    
+    # GitHub pain points summary if available
+    if github_insights.get('top_developer_pain_points'):
+        st.markdown("### Developer Pain Point Frequency (from GitHub)")
+        
+        github_df = pd.DataFrame(github_insights['top_developer_pain_points'])
+        
+        fig = px.bar(github_df, x='keyword', y='occurrences',
+                    color='severity',
+                    title='Most Frequent Developer Complaints',
+                    labels={'keyword': 'Pain Point', 'occurrences': 'Number of Issues'})
+        st.plotly_chart(fig, use_container_width=True)
+        show_python_viz_attribution()
+    
+    # Confidence
+    st.markdown("---")
+    show_confidence(pain_data.get('confidence', 'Unknown'),
+                   pain_data.get('confidence_rationale', ''))
+
+@st.fragment
+def _render_competitive(results):
+    """Render the Competitive Landscape page."""
+    import plotly.express as px
+
+    st.header("Competitive Landscape")
+    
+    if 'competitive_landscape' not in results:
+        st.warning("Competitive Landscape data not available")
+        return
+    
+    comp_data = results['competitive_landscape']
+    solutions = comp_data.get('solutions', [])
+    
+    st.markdown(_VENDOR_BADGE_HTML, unsafe_allow_html=True)
+    
+    # Summary metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Solutions Analyzed", len(solutions))
+    
+    with col2:
+        st.metric("Market Coverage", f"{comp_data.get('market_coverage_percent', 0)}%")
+    
+    with col3:
+        categories = set(sol.get('category', 'Unknown') for sol in solutions)
+        st.metric("Categories", len(categories))
+    
+    # Competitive positioning chart
+    st.markdown("### Performance vs Power Efficiency")
+
+    solutions_df = pd.json_normalize(solutions) if solutions else pd.DataFrame()
+    if not solutions_df.empty:
+        solutions_df['TOPS'] = pd.to_numeric(
+            solutions_df.get('specifications.compute_tops'), errors='coerce')
+        solutions_df['Power (W)'] = pd.to_numeric(
+            solutions_df.get('specifications.power_consumption_w'), errors='coerce')
+
+    chart_df = (
+        solutions_df.dropna(subset=['TOPS', 'Power (W)'])
+        .rename(columns={'company': 'Company', 'product': 'Product',
+                         'category': 'Category', 'market_position': 'Position'})
+        if not solutions_df.empty else solutions_df
+    )
+
+    if not chart_df.empty:
+        df = chart_df
+        fig = px.scatter(df, x='Power (W)', y='TOPS',
+                       size='TOPS', color='Category',
+                       hover_data=['Company', 'Product', 'Position'],
+                       title='AI Compute Performance vs Power Consumption')
+        st.plotly_chart(fig, use_container_width=True)
+        show_python_viz_attribution()
+    
+    # Solutions table
+    st.markdown("### All Solutions")
+    
+    # Filters
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        category_filter = st.multiselect(
+            "Filter by Category",
+            options=sorted(categories),
+            default=list(categories)
+        )
+    
+    with col2:
+        positions = sorted(set(sol.get('market_position', 'Unknown') for sol in solutions))
+        position_filter = st.multiselect(
+            "Filter by Position",
+            options=positions,
+            default=positions
+        )
+    
+    # Single C-level mask instead of two Python filter loops
+    if not solutions_df.empty:
+        mask = (solutions_df['category'].isin(category_filter)
+                & solutions_df['market_position'].isin(position_filter))
+        df_view = (
+            solutions_df.loc[mask]
+            .reindex(columns=['company', 'product', 'category',
+                              'TOPS', 'Power (W)',
+                              'specifications.process_node_nm',
+                              'market_position'])
+            .rename(columns={'company': 'Company', 'product': 'Product',
+                             'category': 'Category',
+                             'specifications.process_node_nm': 'Process (nm)',
+                             'market_position': 'Position'})
+        )
+        if not df_view.empty:
+            st.dataframe(df_view, use_container_width=True, hide_index=True)
+    
+    # Confidence
+    st.markdown("---")
+    show_confidence(comp_data.get('confidence', 'Unknown'),
+                   comp_data.get('confidence_rationale', ''))
+
+@st.fragment
+def _render_opportunity_card(opp, *, mode='gap'):
+    """Render one opportunity card, shared by the gap and positioning pages.
+
+    Args:
+        opp: Opportunity dict from the relevant agent result
+        mode: 'gap' for gap-analysis cards, 'positioning' for go-to-market cards
+    """
+    if mode == 'positioning':
+        st.markdown(f"## {opp.get('opportunity_name', 'Unknown')}")
+
+        # Elevator pitch
+        st.markdown("### Elevator Pitch")
+        st.info(opp.get('elevator_pitch', 'N/A'))
+
+        # Taglines
+        st.markdown("### Tagline Options")
+        st.markdown("\n".join(
+            f'- *"{tagline}"*' for tagline in opp.get('tagline_options', [])))
+
+        # USP
+        st.markdown("### Unique Selling Proposition")
+        usp = opp.get('usp', {})
+
+        st.markdown(f"> {usp.get('core_differentiation', 'N/A')}")
+
+        with st.expander("View Proof Points"):
+            st.markdown("\n".join(
+                f"- {proof}" for proof in usp.get('proof_points', [])))
+
+        st.divider()
+        return
+
+    st.markdown(f"## #{opp['rank']}: {opp['name']}")
+
+    # Metrics
+    col1, col2, col3, col4 = st.columns(4)
+
+    market = opp.get('market_size') or _EMPTY
+    execution = opp.get('execution') or _EMPTY
+
+    with col1:
+        st.metric("Market Size", f"${market.get('addressable_market_usd_millions', 0)}M")
+
+    with col2:
+        st.metric("Revenue Potential", market.get('revenue_potential_range_usd_millions', 'N/A'))
+
+    with col3:
+        st.metric("Time to Market", execution.get('time_to_market_months_range', 'N/A'))
+
+    with col4:
+        risk = execution.get('risk_level', 'Unknown')
+        color = _RISK_COLORS.get(risk, 'gray')
+        st.metric("Risk", f":{color}[{risk}]")
+
+    # Details
+    st.markdown(f"**Target Segment:** {opp.get('target_segment', 'N/A')}")
+    st.markdown(f"**Unmet Need:** {opp.get('unmet_need', 'N/A')}")
+    st.markdown(f"**Technical Gap:** {opp.get('technical_gap', 'N/A')}")
+
+    # Heavy subsections only materialize when opened
+    with st.expander("Differentiators & Evidence", expanded=False):
+        st.markdown("**Key Differentiators:**\n" + "\n".join(
+            f"- {diff}" for diff in opp.get('key_differentiators', [])))
+
+        st.markdown("**Supporting Evidence:**")
+        for evidence in opp.get('supporting_evidence', []):
+            with st.container(border=True):
+                st.markdown(f"**{evidence.get('source', 'Unknown')}**  \n"
+                            f"{evidence.get('claim', 'N/A')}")
+
+    st.divider()
+
+@st.fragment
+def _render_gap_analysis(results):
+    """Render the Gap Analysis & Market Opportunities page."""
+    st.header("Gap Analysis & Market Opportunities")
+    
+    if 'gap_analysis' not in results:
+        st.warning("Gap Analysis data not available")
+        return
+    
+    gap_data = results['gap_analysis']
+    opportunities = gap_data.get('opportunities', [])
+    
+    st.markdown(_SYNTH_BADGE_HTML, unsafe_allow_html=True)
+    
+    st.metric("Opportunities Identified", len(opportunities))
+    
+    # Opportunity comparison
+    st.markdown("### Opportunity Comparison Matrix")
+    
+    comp_df = build_opps_comparison_df(_scan_latest_timestamp()[0], opportunities)
+    st.dataframe(comp_df, use_container_width=True, hide_index=True)
+    
+    # Detailed opportunities
+    st.markdown("### Detailed Opportunity Analysis")
+
+    # Lazy rendering: only the first batch is materialized eagerly, the
+    # rest appear on demand so large runs don't recreate hundreds of
+    # widgets per rerun
+    shown = st.session_state.setdefault('shown_opps', 10)
+
+    for opp in opportunities[:shown]:
+        _render_opportunity_card(opp, mode='gap')
+
+    if len(opportunities) > shown:
+        if st.button(f"Load more ({len(opportunities) - shown} remaining)"):
+            st.session_state['shown_opps'] = shown + 10
+            st.rerun(scope="fragment")
+
+    # Confidence
+    st.markdown("---")
+    show_confidence(gap_data.get('confidence', 'Unknown'),
+                   gap_data.get('confidence_rationale', ''))
+
+@st.fragment
+def _render_positioning(results):
+    """Render the Positioning & Messaging Strategy page."""
+    st.header("Positioning & Messaging Strategy")
+    
+    if 'positioning_messaging' not in results:
+        st.warning("Positioning & Messaging data not available")
+        return
+    
+    pos_data = results['positioning_messaging']
+    opportunities = pos_data.get('opportunities', [])
+    
+    st.markdown(_GTM_BADGE_HTML, unsafe_allow_html=True)
+    
+    st.metric("Opportunities Positioned", len(opportunities))
+    
+    for opp in opportunities:
+        _render_opportunity_card(opp, mode='positioning')
+    
+    # Confidence
+    st.markdown("---")
+    show_confidence(pos_data.get('confidence', 'Unknown'),
+                   pos_data.get('confidence_rationale', ''))
+
+@st.fragment
+def _render_assumptions(results):
+    """Render the Assumptions Tracker page."""
+    st.header("Assumptions Tracker")
+    
+    st.markdown("""
+    This page tracks all assumptions made during the analysis. Understanding these assumptions 
+    is critical for validating the conclusions.
+    """)
+    
+    # Collect all assumptions from all agents (cached per run)
+    all_assumptions = build_assumptions_table(_scan_latest_timestamp()[0], results)
+    
+    # Display assumptions
+    if all_assumptions:
+        st.metric("Total Assumptions Tracked", len(all_assumptions))
+        
+        # Display as cards
+        for i, assumption in enumerate(all_assumptions, 1):
+            with st.container(border=True):
+                st.markdown(
+                    f"**#{i} - {assumption['Agent']}** ({assumption['Type']})  \n"
+                    f"**Assumption:** {assumption['Assumption']}  \n"
+                    f"**Risk if Wrong:** {assumption['Risk if Wrong']}  \n"
+                    f"**Validation Signal:** {assumption['Validation Signal']}"
+                )
+    else:
+        st.info("No explicit assumptions tracked. Run gap_analysis agent to populate.")
+    
+    # AI assumptions (meta)
+    st.markdown("### AI Model & Data Assumptions")
+    
+    with st.container(border=True):
+        st.markdown("""
+**AI Analysis Framework:**
+- Language Model: Claude Sonnet 4.5 (Anthropic)
+- Analysis based on patterns in provided data, not domain expertise
+- Confidence ratings reflect data quality and convergence, not certainty
+- All numeric estimates should be validated with industry experts
+
+**Data Enhancement:**
+- API integrations (USPTO, GitHub) provide real-time validation
+- Visualizations generated programmatically using Python (Plotly)
+- Analysis replicable and version-controlled
+""")
+
+def _render_kpi_grid(items):
+    """Render a list of (label, value) KPIs as one HTML grid blob."""
+    st.markdown(
+        '<div class="kpi-grid">'
+        + ''.join(f'<div class="kpi"><div class="label">{k}</div>'
+                  f'<div class="value">{v}</div></div>' for k, v in items)
+        + '</div>',
+        unsafe_allow_html=True)
+
+@st.fragment
+def _render_compute_architecture(results):
+    """Render the Compute Architecture Requirements page."""
+    st.header("Compute Architecture Requirements")
+
+    if 'compute_architecture' not in results:
+        st.warning("Compute Architecture data not available")
+        return
+
+    arch_data = results['compute_architecture']
+
+    st.markdown(_AI_BADGE_HTML, unsafe_allow_html=True)
+
+    # Each section renders as one HTML KPI grid blob instead of a
+    # cluster of individual st.metric widgets
+    camera = arch_data.get('camera_processing') or _EMPTY
+    radar = arch_data.get('radar_processing') or _EMPTY
+    fusion = arch_data.get('sensor_fusion') or _EMPTY
+    ai_ml = arch_data.get('ai_ml_inference') or _EMPTY
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### Camera Processing")
+        _render_kpi_grid([
+            ('Resolution', camera.get('target_resolution', 'N/A')),
+            ('Frame Rate', f"{camera.get('frame_rate_fps', 0)} fps"),
+            ('Compute', camera.get('compute_tops', 'N/A')),
+            ('Memory Bandwidth', camera.get('memory_bandwidth_gbps', 'N/A')),
+            ('Power Budget', camera.get('power_budget_w', 'N/A'))
+        ])
+
+        st.markdown("### Sensor Fusion")
+        _render_kpi_grid([
+            ('Approach', fusion.get('fusion_approach', 'N/A')),
+            ('Compute', fusion.get('compute_tops', 'N/A')),
+            ('Memory', fusion.get('memory_gb', 'N/A')),
+            ('Real-Time', fusion.get('real_time_requirements', 'N/A')),
+            ('Power Budget', fusion.get('power_budget_w', 'N/A'))
+        ])
+
+    with col2:
+        st.markdown("### Radar Processing")
+        _render_kpi_grid([
+            ('Frequency Band', radar.get('frequency_band', 'N/A')),
+            ('Compute', radar.get('compute_tops', 'N/A')),
+            ('Latency Target', radar.get('latency_target_ms', 'N/A')),
+            ('Power Budget', radar.get('power_budget_w', 'N/A'))
+        ])
+
+        st.markdown("### AI/ML Inference")
+        _render_kpi_grid([
+            ('Model Size', ai_ml.get('typical_model_size', 'N/A')),
+            ('Inference Latency', ai_ml.get('inference_latency_ms', 'N/A')),
+            ('Compute', ai_ml.get('compute_tops', 'N/A')),
+            ('Efficiency', ai_ml.get('power_efficiency_tops_per_watt', 'N/A'))
+        ])
+
+    # Recommendations
+    recs = arch_data.get('architecture_recommendations') or _EMPTY
+    if recs:
+        st.markdown("### Architecture Recommendations")
+        st.markdown(f"**Preferred Approach:** {recs.get('preferred_approach', 'N/A')}")
+
+        st.markdown("**Key Trade-offs:**\n" + "\n".join(
+            f"- {t}" for t in recs.get('key_trade_offs', [])))
+        st.markdown("**Critical Bottlenecks:**\n" + "\n".join(
+            f"- ⚠️ {b}" for b in recs.get('critical_bottlenecks', [])))
+
+    # Confidence
+    st.markdown("---")
+    show_confidence(arch_data.get('confidence', 'Unknown'),
+                   arch_data.get('confidence_rationale', ''))
+
+# O(1) dispatch table for page rendering; the executive page is handled
+# separately because it also takes metadata and the execution log
+_PAGE_HANDLERS = {
+    "market_size": _render_market_size,
+    "trends_simplification": _render_trends,
+    "pain_point_extraction": _render_pain_points,
+    "competitive_landscape": _render_competitive,
+    "compute_architecture": _render_compute_architecture,
+    "gap_analysis": _render_gap_analysis,
+    "positioning_messaging": _render_positioning,
+    "assumptions": _render_assumptions,
+}
+
 def main():
     """Main dashboard function."""
     
@@ -328,727 +1299,14 @@ def main():
         st.write(f"Loaded agents: {len(results)}")
         st.write(f"Agent keys: {list(results.keys())}")
     
-    # ==================================
-    # PAGE: EXECUTIVE SUMMARY
-    # ==================================
+    # Render the selected page as a fragment so widget interactions
+    # inside a page rerun only that page, not the whole script
     if page_key == "executive":
-        st.header("Executive Summary")
-        
-        # Show API enhancement status
-        apis_available = metadata.get('apis_available', {})
-        if any(apis_available.values()):
-            st.markdown('<div class="api-status-box">', unsafe_allow_html=True)
-            st.markdown("**Data Enhanced With:**")
-            if apis_available.get('uspto'):
-                st.markdown("- USPTO Patent Database (innovation trends, filing velocity)")
-            if apis_available.get('github'):
-                st.markdown("- GitHub Developer Feedback (real pain points from ADAS projects)")
-            if apis_available.get('semantic_scholar'):
-                st.markdown("- Semantic Scholar (academic research validation)")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Quick metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        market_data = results.get('market_size', {})
-        gap_data = results.get('gap_analysis', {})
-        
-        with col1:
-            st.metric("Current Market", 
-                     f"${market_data.get('current_market_size_usd_millions', 0):,}M",
-                     f"{market_data.get('base_year', 'N/A')}")
-        
-        with col2:
-            st.metric("2030 Projection",
-                     f"${market_data.get('projected_market_size_usd_millions', 0):,}M",
-                     f"+{market_data.get('cagr_percent', 0)}%")
-        
-        with col3:
-            opportunities = gap_data.get('opportunities', [])
-            st.metric("Opportunities", len(opportunities))
-        
-        with col4:
-            trends_data = results.get('trends_simplification', {})
-            trends = trends_data.get('trends', [])
-            st.metric("Key Trends", len(trends))
-        
-        # Top insights
-        st.markdown("### Key Insights")
-        
-        if opportunities:
-            top_opp = opportunities[0]
-            market_size = top_opp.get('market_size', {})
-            
-            st.markdown(f"""
-            <div class="evidence-box">
-            <strong>Top Opportunity:</strong> {top_opp.get('name', 'Unknown')}<br>
-            <strong>Market Size:</strong> ${market_size.get('addressable_market_usd_millions', 0)}M<br>
-            <strong>Revenue Potential:</strong> {market_size.get('revenue_potential_range_usd_millions', 'N/A')}<br>
-            <strong>Risk Level:</strong> {top_opp.get('execution', {}).get('risk_level', 'Unknown')}
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Agent execution status
-        st.markdown("### Analysis Execution Timeline")
-        
-        if execution_log:
-            timeline_df = pd.DataFrame([
-                {
-                    'Agent': log['agent'].replace('_', ' ').title(),
-                    'Status': 'Success' if log['success'] else 'Failed',
-                    'Confidence': log.get('confidence', 'Unknown'),
-                    'Time': datetime.fromisoformat(log['timestamp']).strftime("%H:%M:%S"),
-                    'APIs Used': ', '.join([
-                        k.replace('_data', '').upper() 
-                        for k, v in log.get('data_sources', {}).items() 
-                        if 'api' in str(v)
-                    ]) or 'None'
-                }
-                for log in execution_log
-            ])
-            st.dataframe(timeline_df, use_container_width=True, hide_index=True)
-    
-    # ==================================
-    # PAGE: MARKET SIZE
-    # ==================================
-    elif page_key == "market_size":
-        st.header("Market Size Analysis")
-        
-        if 'market_size' not in results:
-            st.warning("Market Size data not available")
-            return
-        
-        market_data = results['market_size']
-        
-        # Attribution
-        st.markdown('<span class="source-badge">Based on Financial Research Sources</span>', unsafe_allow_html=True)
-        
-        # Key metrics
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Current Market",
-                     f"${market_data.get('current_market_size_usd_millions', 0):,}M",
-                     f"Base: {market_data.get('base_year', 'N/A')}")
-        
-        with col2:
-            st.metric("2030 Projection",
-                     f"${market_data.get('projected_market_size_usd_millions', 0):,}M",
-                     f"Year: {market_data.get('projection_year', 'N/A')}")
-        
-        with col3:
-            st.metric("CAGR", f"{market_data.get('cagr_percent', 0)}%")
-        
-        # Market growth chart
-        st.markdown("### Market Growth Projection")
-        
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=['Current (2023)', 'Projected (2030)'],
-            y=[market_data.get('current_market_size_usd_millions', 0),
-               market_data.get('projected_market_size_usd_millions', 0)],
-            marker_color=['#1f77b4', '#2ecc71'],
-            text=[f"${market_data.get('current_market_size_usd_millions', 0)}M",
-                  f"${market_data.get('projected_market_size_usd_millions', 0)}M"],
-            textposition='auto'
-        ))
-        
-        fig.update_layout(
-            title=f"US ADAS Semiconductor Market ({market_data.get('cagr_percent', 0)}% CAGR)",
-            yaxis_title="Market Size (USD Millions)",
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        show_python_viz_attribution()
-        
-        # Segment breakdown
-        st.markdown("### Market Breakdown by Segment")
-        
-        breakdown = market_data.get('breakdown', {})
-        if breakdown:
-            segment_df = pd.DataFrame([
-                {
-                    'Segment': 'Camera',
-                    'Size ($M)': breakdown['camera']['size_usd_millions'],
-                    'Percentage': f"{breakdown['camera']['percentage']}%"
-                },
-                {
-                    'Segment': 'Radar',
-                    'Size ($M)': breakdown['radar']['size_usd_millions'],
-                    'Percentage': f"{breakdown['radar']['percentage']}%"
-                },
-                {
-                    'Segment': 'Sensor Fusion/Compute',
-                    'Size ($M)': breakdown['sensor_fusion_compute']['size_usd_millions'],
-                    'Percentage': f"{breakdown['sensor_fusion_compute']['percentage']}%"
-                }
-            ])
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.dataframe(segment_df, use_container_width=True, hide_index=True)
-            
-            with col2:
-                fig = go.Figure(data=[go.Pie(
-                    labels=['Camera', 'Radar', 'Sensor Fusion/Compute'],
-                    values=[
-                        breakdown['camera']['size_usd_millions'],
-                        breakdown['radar']['size_usd_millions'],
-                        breakdown['sensor_fusion_compute']['size_usd_millions']
-                    ],
-                    hole=0.3
-                )])
-                fig.update_layout(title="Market Breakdown (2023)", height=400)
-                st.plotly_chart(fig, use_container_width=True)
-                show_python_viz_attribution()
-        
-        # Data sources
-        st.markdown("### Primary Data Sources")
-        st.markdown('<span class="source-badge">Research Sources</span>', unsafe_allow_html=True)
-        
-        for source in market_data.get('sources', []):
-            with st.expander(f"**{source.get('name', 'Unknown')}** ({source.get('year', 'N/A')})"):
-                st.markdown(f"**Finding:** {source.get('figure', 'N/A')}")
-                if source.get('url'):
-                    st.markdown(f"**URL:** {source.get('url', 'N/A')}")
-        
-        # Confidence
-        st.markdown("---")
-        show_confidence(market_data.get('confidence', 'Unknown'),
-                       market_data.get('confidence_rationale', ''))
-    
-    # ==================================
-    # PAGE: TRENDS
-    # ==================================
-    elif page_key == "trends_simplification":
-        st.header("Technology Trends Analysis")
-        
-        if 'trends_simplification' not in results:
-            st.warning("Trends data not available")
-            return
-        
-        trends_data = results['trends_simplification']
-        trends = trends_data.get('trends', [])
-        
-        # Show data sources
-        data_sources = trends_data.get('data_sources', {})
-        st.markdown('<span class="ai-badge">AI Analysis (Claude Sonnet 4.5)</span>', unsafe_allow_html=True)
-        show_api_data_sources(data_sources)
-        
-        # Patent insights if available
-        patent_insights = trends_data.get('patent_insights', {})
-        if patent_insights.get('data_available'):
-            st.markdown(f"""
-            <div class="api-status-box">
-            <strong>Enhanced with USPTO Patent Data:</strong><br>
-            - Patent Filing Analysis: {', '.join(patent_insights.get('top_innovators', [])[:3])} leading innovation<br>
-            - Emerging Technologies Identified: {len(patent_insights.get('emerging_technologies', []))} areas with rapid patent growth
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.metric("Trends Identified", len(trends))
-        
-        # Timeline filter
-        timelines = sorted(set(t.get('timeline', 'Unknown') for t in trends))
-        selected_timeline = st.selectbox("Filter by Timeline", ['All'] + timelines)
-        
-        filtered_trends = trends if selected_timeline == 'All' else [
-            t for t in trends if t.get('timeline') == selected_timeline
-        ]
-        
-        # Display trends
-        for i, trend in enumerate(filtered_trends, 1):
-            st.markdown(f"### {i}. {trend.get('name', 'Unknown')}")
-            
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"**Description:** {trend.get('description', 'N/A')}")
-                st.markdown(f"**Silicon Implication:** {trend.get('silicon_implication', 'N/A')}")
-                
-                # Show innovation velocity if available (from USPTO data)
-                if trend.get('innovation_velocity'):
-                    velocity_colors = {
-                        'accelerating': 'green',
-                        'steady': 'blue',
-                        'maturing': 'orange',
-                        'declining': 'red'
-                    }
-                    velocity = trend['innovation_velocity']
-                    color = velocity_colors.get(velocity, 'gray')
-                    st.markdown(f"**Innovation Velocity:** :{color}[{velocity.title()}]")
-            
-            with col2:
-                st.metric("Timeline", trend.get('timeline', 'Unknown'))
-            
-            # Evidence
-            evidence = trend.get('evidence', {})
-            if evidence:
-                evidence_type = evidence.get('type', 'Unknown')
-                badge_type = "api-badge" if evidence_type == "patent_data" else "source-badge"
-                
-                st.markdown(f"""
-                <div class="evidence-box">
-                <span class="{badge_type}">{evidence_type.replace('_', ' ').title()}</span><br><br>
-                <strong>Source:</strong> {evidence.get('source', 'Unknown')}<br>
-                <strong>Evidence:</strong> {evidence.get('key_quote', 'N/A')}
-                """, unsafe_allow_html=True)
-                
-                # Add patent filing data if available
-                if evidence.get('patent_filings'):
-                    st.markdown(f"<br><strong>Patent Activity:</strong> {evidence['patent_filings']}", unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)
-            
-            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
-        
-        # Acronyms
-        st.markdown("### Acronyms & Definitions")
-        acronyms = trends_data.get('acronyms_defined', {})
-        
-        if acronyms:
-            acro_df = pd.DataFrame([
-                {'Acronym': k, 'Definition': v}
-                for k, v in acronyms.items()
-            ])
-            st.dataframe(acro_df, use_container_width=True, hide_index=True)
-        
-        # Confidence
-        st.markdown("---")
-        show_confidence(trends_data.get('confidence', 'Unknown'),
-                       trends_data.get('confidence_rationale', ''))
-    
-    # ==================================
-    # PAGE: PAIN POINTS
-    # ==================================
-    elif page_key == "pain_point_extraction":
-        st.header("Market Pain Points Analysis")
-        
-        if 'pain_point_extraction' not in results:
-            st.warning("Pain Points data not available")
-            return
-        
-        pain_data = results['pain_point_extraction']
-        pain_points = pain_data.get('pain_points', [])
-        summary = pain_data.get('summary', {})
-        
-        # Show data sources
-        data_sources = pain_data.get('data_sources', {})
-        st.markdown('<span class="source-badge">From Industry Reports & Stakeholder Statements</span>', unsafe_allow_html=True)
-        show_api_data_sources(data_sources)
-        
-        # GitHub insights if available
-        github_insights = pain_data.get('github_insights', {})
-        if github_insights.get('data_available'):
-            st.markdown(f"""
-            <div class="api-status-box">
-            <strong>Enhanced with GitHub Developer Feedback:</strong><br>
-            - Analyzed {github_insights.get('total_issues_analyzed', 0)} real issues from: {', '.join(github_insights.get('repos_analyzed', []))}<br>
-            - Top developer complaints validated with actual bug reports and feature requests
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Summary
-        col1, col2, col3, col4 = st.columns(4)
-        
-        by_category = summary.get('by_category', {})
-        
-        with col1:
-            st.metric("Total Pain Points", summary.get('total_pain_points', 0))
-        
-        with col2:
-            st.metric("Technical", by_category.get('technical', 0))
-        
-        with col3:
-            st.metric("Business", by_category.get('business', 0))
-        
-        with col4:
-            st.metric("Operational", by_category.get('operational', 0))
-        
-        # Top 3 critical
-        st.markdown("### Top 3 Critical Pain Points")
-        for point in summary.get('top_3_critical', []):
-            st.markdown(f"- **{point}**")
-        
-        # Filters
-        st.markdown("### All Pain Points")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            categories = sorted(set(p['category'] for p in pain_points))
-            category_filter = st.selectbox("Filter by Category", ['All'] + categories)
-        
-        with col2:
-            severities = ['All', 'High', 'Medium', 'Low']
-            severity_filter = st.selectbox("Filter by Severity", severities)
-        
-        filtered_points = pain_points
-        if category_filter != 'All':
-            filtered_points = [p for p in filtered_points if p['category'] == category_filter]
-        if severity_filter != 'All':
-            filtered_points = [p for p in filtered_points if p['severity'] == severity_filter]
-        
-        # Display pain points
-        for pain in filtered_points:
-            severity = pain.get('severity', 'Unknown')
-            severity_indicator = {'High': ':red[●]', 'Medium': ':orange[●]', 'Low': ':green[●]'}
-            indicator = severity_indicator.get(severity, ':gray[●]')
-            
-            with st.expander(f"{indicator} **{pain.get('title', 'Unknown')}**"):
-                st.markdown(f"**Category:** {pain.get('category', 'N/A')}")
-                st.markdown(f"**Severity:** {severity}")
-                
-                st.markdown(f"**Description:** {pain.get('description', 'N/A')}")
-                st.markdown(f"**Impact:** {pain.get('impact', 'N/A')}")
-                
-                st.markdown("**Impacted Stakeholders:**")
-                for stakeholder in pain.get('impacted_stakeholders', []):
-                    st.markdown(f"- {stakeholder}")
-                
-                # Evidence
-                evidence = pain.get('evidence', {})
-                if evidence:
-                    evidence_type = evidence.get('source_type', 'Unknown')
-                    badge_type = "api-badge" if evidence_type == "github_issues" else "source-badge"
-                    
-                    st.markdown(f"""
-                    <div class="evidence-box">
-                    <span class="{badge_type}">{evidence_type.replace('_', ' ').title()}</span><br><br>
-                    <strong>Source:</strong> {evidence.get('source_name', 'Unknown')}<br>
-                    <strong>Evidence:</strong> {evidence.get('key_quote', 'N/A')}
-                    """, unsafe_allow_html=True)
-                    
-                    # Add GitHub-specific data if available
-                    if evidence.get('github_issue_count'):
-                        st.markdown(f"<br><strong>Related GitHub Issues:</strong> {evidence['github_issue_count']}", unsafe_allow_html=True)
-                        st.markdown(f"<strong>Developer Priority:</strong> {evidence.get('developer_priority', 'Unknown')}", unsafe_allow_html=True)
-                    
-                    st.markdown("</div>", unsafe_allow_html=True)
-        
-        # GitHub pain points summary if available
-        if github_insights.get('top_developer_pain_points'):
-            st.markdown("### Developer Pain Point Frequency (from GitHub)")
-            
-            github_df = pd.DataFrame(github_insights['top_developer_pain_points'])
-            
-            fig = px.bar(github_df, x='keyword', y='occurrences',
-                        color='severity',
-                        title='Most Frequent Developer Complaints',
-                        labels={'keyword': 'Pain Point', 'occurrences': 'Number of Issues'})
-            st.plotly_chart(fig, use_container_width=True)
-            show_python_viz_attribution()
-        
-        # Confidence
-        st.markdown("---")
-        show_confidence(pain_data.get('confidence', 'Unknown'),
-                       pain_data.get('confidence_rationale', ''))
-    
-    # ==================================
-    # PAGE: COMPETITIVE LANDSCAPE
-    # ==================================
-    elif page_key == "competitive_landscape":
-        st.header("Competitive Landscape")
-        
-        if 'competitive_landscape' not in results:
-            st.warning("Competitive Landscape data not available")
-            return
-        
-        comp_data = results['competitive_landscape']
-        solutions = comp_data.get('solutions', [])
-        
-        st.markdown('<span class="source-badge">From Vendor Specifications</span>', unsafe_allow_html=True)
-        
-        # Summary metrics
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Solutions Analyzed", len(solutions))
-        
-        with col2:
-            st.metric("Market Coverage", f"{comp_data.get('market_coverage_percent', 0)}%")
-        
-        with col3:
-            categories = set(sol.get('category', 'Unknown') for sol in solutions)
-            st.metric("Categories", len(categories))
-        
-        # Competitive positioning chart
-        st.markdown("### Performance vs Power Efficiency")
-        
-        chart_data = []
-        for sol in solutions:
-            specs = sol.get('specifications', {})
-            tops = specs.get('compute_tops', 'Unknown')
-            power = specs.get('power_consumption_w', 'Unknown')
-            
-            if tops != 'Unknown' and power != 'Unknown':
-                try:
-                    chart_data.append({
-                        'Company': sol['company'],
-                        'Product': sol['product'],
-                        'TOPS': float(tops),
-                        'Power (W)': float(power),
-                        'Category': sol['category'],
-                        'Position': sol['market_position']
-                    })
-                except:
-                    pass
-        
-        if chart_data:
-            df = pd.DataFrame(chart_data)
-            fig = px.scatter(df, x='Power (W)', y='TOPS',
-                           size='TOPS', color='Category',
-                           hover_data=['Company', 'Product', 'Position'],
-                           title='AI Compute Performance vs Power Consumption')
-            st.plotly_chart(fig, use_container_width=True)
-            show_python_viz_attribution()
-        
-        # Solutions table
-        st.markdown("### All Solutions")
-        
-        # Filters
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            category_filter = st.multiselect(
-                "Filter by Category",
-                options=sorted(categories),
-                default=list(categories)
-            )
-        
-        with col2:
-            positions = sorted(set(sol.get('market_position', 'Unknown') for sol in solutions))
-            position_filter = st.multiselect(
-                "Filter by Position",
-                options=positions,
-                default=positions
-            )
-        
-        filtered_solutions = [
-            sol for sol in solutions
-            if sol.get('category') in category_filter
-            and sol.get('market_position') in position_filter
-        ]
-        
-        table_data = []
-        for sol in filtered_solutions:
-            specs = sol.get('specifications', {})
-            table_data.append({
-                'Company': sol['company'],
-                'Product': sol['product'],
-                'Category': sol['category'],
-                'TOPS': specs.get('compute_tops', 'Unknown'),
-                'Power (W)': specs.get('power_consumption_w', 'Unknown'),
-                'Process (nm)': specs.get('process_node_nm', 'Unknown'),
-                'Position': sol['market_position']
-            })
-        
-        if table_data:
-            st.dataframe(pd.DataFrame(table_data), use_container_width=True, hide_index=True)
-        
-        # Confidence
-        st.markdown("---")
-        show_confidence(comp_data.get('confidence', 'Unknown'),
-                       comp_data.get('confidence_rationale', ''))
-    
-    # ==================================
-    # PAGE: GAP ANALYSIS
-    # ==================================
-    elif page_key == "gap_analysis":
-        st.header("Gap Analysis & Market Opportunities")
-        
-        if 'gap_analysis' not in results:
-            st.warning("Gap Analysis data not available")
-            return
-        
-        gap_data = results['gap_analysis']
-        opportunities = gap_data.get('opportunities', [])
-        
-        st.markdown('<span class="ai-badge">AI-Synthesized from All Previous Agents (Claude Sonnet 4.5)</span>', unsafe_allow_html=True)
-        
-        st.metric("Opportunities Identified", len(opportunities))
-        
-        # Opportunity comparison
-        st.markdown("### Opportunity Comparison Matrix")
-        
-        comp_data = []
-        for opp in opportunities:
-            market = opp.get('market_size', {})
-            execution = opp.get('execution', {})
-            
-            comp_data.append({
-                'Rank': opp['rank'],
-                'Opportunity': opp['name'][:50] + '...' if len(opp['name']) > 50 else opp['name'],
-                'Market ($M)': market.get('addressable_market_usd_millions', 0),
-                'Revenue ($M)': market.get('revenue_potential_range_usd_millions', 'N/A'),
-                'Time (mo)': execution.get('time_to_market_months_range', 'N/A'),
-                'ROI': execution.get('estimated_roi_range', 'N/A'),
-                'Risk': execution.get('risk_level', 'Unknown')
-            })
-        
-        st.dataframe(pd.DataFrame(comp_data), use_container_width=True, hide_index=True)
-        
-        # Detailed opportunities
-        st.markdown("### Detailed Opportunity Analysis")
-        
-        for opp in opportunities:
-            st.markdown(f"## #{opp['rank']}: {opp['name']}")
-            
-            # Metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            market = opp.get('market_size', {})
-            execution = opp.get('execution', {})
-            
-            with col1:
-                st.metric("Market Size", f"${market.get('addressable_market_usd_millions', 0)}M")
-            
-            with col2:
-                st.metric("Revenue Potential", market.get('revenue_potential_range_usd_millions', 'N/A'))
-            
-            with col3:
-                st.metric("Time to Market", execution.get('time_to_market_months_range', 'N/A'))
-            
-            with col4:
-                risk = execution.get('risk_level', 'Unknown')
-                risk_colors = {'High': 'red', 'Medium': 'orange', 'Low': 'green'}
-                color = risk_colors.get(risk, 'gray')
-                st.metric("Risk", f":{color}[{risk}]")
-            
-            # Details
-            st.markdown(f"**Target Segment:** {opp.get('target_segment', 'N/A')}")
-            st.markdown(f"**Unmet Need:** {opp.get('unmet_need', 'N/A')}")
-            st.markdown(f"**Technical Gap:** {opp.get('technical_gap', 'N/A')}")
-            
-            # Differentiators
-            st.markdown("**Key Differentiators:**")
-            for diff in opp.get('key_differentiators', []):
-                st.markdown(f"- {diff}")
-            
-            # Evidence
-            st.markdown("**Supporting Evidence:**")
-            for evidence in opp.get('supporting_evidence', []):
-                st.markdown(f"""
-                <div class="evidence-box">
-                <strong>{evidence.get('source', 'Unknown')}</strong><br>
-                {evidence.get('claim', 'N/A')}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
-        
-        # Confidence
-        st.markdown("---")
-        show_confidence(gap_data.get('confidence', 'Unknown'),
-                       gap_data.get('confidence_rationale', ''))
-    
-    # ==================================
-    # PAGE: POSITIONING & MESSAGING
-    # ==================================
-    elif page_key == "positioning_messaging":
-        st.header("Positioning & Messaging Strategy")
-        
-        if 'positioning_messaging' not in results:
-            st.warning("Positioning & Messaging data not available")
-            return
-        
-        pos_data = results['positioning_messaging']
-        opportunities = pos_data.get('opportunities', [])
-        
-        st.markdown('<span class="ai-badge">AI-Generated Go-to-Market Strategy (Claude Sonnet 4.5)</span>', unsafe_allow_html=True)
-        
-        st.metric("Opportunities Positioned", len(opportunities))
-        
-        for opp in opportunities:
-            st.markdown(f"## {opp.get('opportunity_name', 'Unknown')}")
-            
-            # Elevator pitch
-            st.markdown("### Elevator Pitch")
-            st.info(opp.get('elevator_pitch', 'N/A'))
-            
-            # Taglines
-            st.markdown("### Tagline Options")
-            for tagline in opp.get('tagline_options', []):
-                st.markdown(f"- *\"{tagline}\"*")
-            
-            # USP
-            st.markdown("### Unique Selling Proposition")
-            usp = opp.get('usp', {})
-            
-            st.markdown(f"> {usp.get('core_differentiation', 'N/A')}")
-            
-            with st.expander("View Proof Points"):
-                for proof in usp.get('proof_points', []):
-                    st.markdown(f"- {proof}")
-            
-            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
-        
-        # Confidence
-        st.markdown("---")
-        show_confidence(pos_data.get('confidence', 'Unknown'),
-                       pos_data.get('confidence_rationale', ''))
-    
-    # ==================================
-    # PAGE: ASSUMPTIONS TRACKER
-    # ==================================
-    elif page_key == "assumptions":
-        st.header("Assumptions Tracker")
-        
-        st.markdown("""
-        This page tracks all assumptions made during the analysis. Understanding these assumptions 
-        is critical for validating the conclusions.
-        """)
-        
-        # Collect all assumptions from all agents
-        all_assumptions = []
-        
-        # From Gap Analysis
-        if 'gap_analysis' in results:
-            gap_assumptions = results['gap_analysis'].get('assumptions', [])
-            for assumption in gap_assumptions:
-                all_assumptions.append({
-                    'Agent': 'Gap Analysis',
-                    'Assumption': assumption.get('assumption', 'N/A'),
-                    'Risk if Wrong': assumption.get('risk_if_wrong', 'N/A'),
-                    'Validation Signal': assumption.get('validation_signal', 'N/A'),
-                    'Type': 'Explicit'
-                })
-        
-        # Display assumptions
-        if all_assumptions:
-            st.metric("Total Assumptions Tracked", len(all_assumptions))
-            
-            # Display as cards
-            for i, assumption in enumerate(all_assumptions, 1):
-                st.markdown(f"""
-                <div class="assumption-box">
-                <strong>#{i} - {assumption['Agent']}</strong> ({assumption['Type']})<br><br>
-                <strong>Assumption:</strong> {assumption['Assumption']}<br>
-                <strong>Risk if Wrong:</strong> {assumption['Risk if Wrong']}<br>
-                <strong>Validation Signal:</strong> {assumption['Validation Signal']}
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.info("No explicit assumptions tracked. Run gap_analysis agent to populate.")
-        
-        # AI assumptions (meta)
-        st.markdown("### AI Model & Data Assumptions")
-        
-        st.markdown("""
-        <div class="assumption-box">
-        <strong>AI Analysis Framework:</strong><br>
-        - Language Model: Claude Sonnet 4.5 (Anthropic)<br>
-        - Analysis based on patterns in provided data, not domain expertise<br>
-        - Confidence ratings reflect data quality and convergence, not certainty<br>
-        - All numeric estimates should be validated with industry experts<br><br>
-        <strong>Data Enhancement:</strong><br>
-        - API integrations (USPTO, GitHub) provide real-time validation<br>
-        - Visualizations generated programmatically using Python (Plotly)<br>
-        - Analysis replicable and version-controlled
-        </div>
-        """, unsafe_allow_html=True)
+        _render_executive(results, metadata, execution_log)
+    else:
+        handler = _PAGE_HANDLERS.get(page_key)
+        if handler:
+            handler(results)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
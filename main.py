@@ -7,32 +7,61 @@ from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 import argparse
-import json
+import orjson
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+import importlib
 
 from utils.api_client import AnthropicClient
 from utils.archive_manager import ArchiveManager
 from orchestrator.master_agent import MasterOpportunityAgent
 
-# Import all 10 agents
-from agents.source_discovery import SourceDiscoveryAgent
-from agents.market_size import MarketSizeAgent
-from agents.trends_simplification import TrendsSimplificationAgent
-from agents.competitive_landscape import CompetitiveLandscapeAgent
-from agents.pain_point_extraction import PainPointExtractionAgent
-from agents.compute_architecture import ComputeArchitectureAgent
-from agents.bottleneck_diagnosis import BottleneckDiagnosisAgent
-from agents.gap_analysis import GapAnalysisAgent
-from agents.positioning_messaging import PositioningMessagingAgent
-from agents.visualization_reporting import VisualizationReportingAgent
+# Agent registry: (module, class, takes_api_client). Agents are imported
+# lazily so a --agent run only pays the import cost of the one it needs.
+_AGENT_SPECS = {
+    'source_discovery': ('agents.source_discovery', 'SourceDiscoveryAgent', True),
+    'market_size': ('agents.market_size', 'MarketSizeAgent', True),
+    'trends_simplification': ('agents.trends_simplification', 'TrendsSimplificationAgent', True),
+    'competitive_landscape': ('agents.competitive_landscape', 'CompetitiveLandscapeAgent', True),
+    'pain_point_extraction': ('agents.pain_point_extraction', 'PainPointExtractionAgent', True),
+    'compute_architecture': ('agents.compute_architecture', 'ComputeArchitectureAgent', True),
+    'bottleneck_diagnosis': ('agents.bottleneck_diagnosis', 'BottleneckDiagnosisAgent', True),
+    'gap_analysis': ('agents.gap_analysis', 'GapAnalysisAgent', True),
+    'positioning_messaging': ('agents.positioning_messaging', 'PositioningMessagingAgent', True),
+    'visualization_reporting': ('agents.visualization_reporting', 'VisualizationReportingAgent', False),
+}
+
+def build_agents(api_client, only: str = None):
+    """Instantiate agents from the registry, importing modules on demand.
+
+    Args:
+        api_client: Anthropic API client passed to agents that need it
+        only: Optional agent name to build just that agent
+    """
+    names = [only] if only else list(_AGENT_SPECS.keys())
+
+    agents = {}
+    for name in names:
+        module_name, class_name, takes_api_client = _AGENT_SPECS[name]
+        agent_cls = getattr(importlib.import_module(module_name), class_name)
+        agents[name] = agent_cls(api_client) if takes_api_client else agent_cls()
+
+    return agents
+
+# Directories already created this process; skips the stat+mkdir
+# syscall after the first ensure
+_ENSURED_DIRS: set = set()
+
+def _ensure_dir(path: Path):
+    """mkdir -p once per process for a given directory."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
 
 def setup_logging(log_level: str = 'INFO'):
     """Configure logging."""
     
     log_dir = Path('logs')
-    log_dir.mkdir(exist_ok=True)
+    _ensure_dir(log_dir)
     
     logging.basicConfig(
         level=getattr(logging, log_level),
@@ -43,25 +72,28 @@ def setup_logging(log_level: str = 'INFO'):
         ]
     )
 
-async def save_result(agent_name: str, result: dict):
-    """Save agent result to JSON file in outputs/reports/ folder."""
-    
+def _write_json_sync(path: Path, result: dict):
+    """Serialize and write a result with one large buffered write."""
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+async def save_result(agent_name: str, result: dict, timestamp: str):
+    """Save agent result to JSON file in outputs/reports/ folder.
+
+    Args:
+        agent_name: Name of the agent that produced the result
+        result: Agent result payload
+        timestamp: Run timestamp, computed once in main()
+    """
+
     output_dir = Path("outputs/reports")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    _ensure_dir(output_dir)
+
     output_file = output_dir / f"{agent_name}_result_{timestamp}.json"
-    
-    # Custom JSON encoder to handle datetime objects
-    class DateTimeEncoder(json.JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()  # Convert datetime to ISO format string
-            return super().default(obj)
-    
-    with open(output_file, "w") as f:
-        json.dump(result, f, indent=4, cls=DateTimeEncoder)
-    
+
+    # Offload the write so large dumps don't block the event loop
+    await asyncio.to_thread(_write_json_sync, output_file, result)
+
     logging.getLogger('main').info(f"✅ Result saved to {output_file}")
 
 async def main():
@@ -90,58 +122,52 @@ async def main():
     run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     try:
-        # Archive previous run BEFORE starting new analysis
-        if not args.no_archive and not args.agent:  # Only archive for full runs
+        # Archive previous run BEFORE starting new analysis; the disk-bound
+        # archive work overlaps API client construction via gather
+        archive_mgr = ArchiveManager()
+
+        async def _archive():
+            if args.no_archive or args.agent:  # Only archive for full runs
+                return
             logger.info("\n📦 Archiving previous run...")
-            archive_mgr = ArchiveManager()
-            archived_folder = archive_mgr.archive_previous_run(run_timestamp)
-            
+            archived_folder = await asyncio.to_thread(
+                archive_mgr.archive_previous_run, run_timestamp)
+
             if archived_folder:
                 logger.info(f"✅ Previous files archived to: {archived_folder}")
-                
+
                 # Clean old archives
-                archive_mgr.clean_old_archives(keep_last_n=args.keep_archives)
+                await asyncio.to_thread(
+                    archive_mgr.clean_old_archives, keep_last_n=args.keep_archives)
             else:
                 logger.info("ℹ️  No previous files to archive")
-        
-        # Initialize API client
-        api_client = AnthropicClient()
+
+        _, api_client = await asyncio.gather(
+            _archive(), asyncio.to_thread(AnthropicClient))
         logger.info("✓ API client initialized")
         
-        # Initialize all 10 agents
-        agents = {
-            'source_discovery': SourceDiscoveryAgent(api_client),
-            'market_size': MarketSizeAgent(api_client),
-            'trends_simplification': TrendsSimplificationAgent(api_client),
-            'competitive_landscape': CompetitiveLandscapeAgent(api_client),
-            'pain_point_extraction': PainPointExtractionAgent(api_client),
-            'compute_architecture': ComputeArchitectureAgent(api_client),
-            'bottleneck_diagnosis': BottleneckDiagnosisAgent(api_client),
-            'gap_analysis': GapAnalysisAgent(api_client),
-            'positioning_messaging': PositioningMessagingAgent(api_client),
-            'visualization_reporting': VisualizationReportingAgent(),
-        }
-        logger.info(f"✓ Initialized {len(agents)} agents")
-        
-        # If specific agent requested, run only that
+        # If specific agent requested, import and run only that one
         if args.agent:
-            if args.agent not in agents:
+            if args.agent not in _AGENT_SPECS:
                 logger.error(f"Agent '{args.agent}' not found")
-                logger.info(f"Available agents: {', '.join(agents.keys())}")
+                logger.info(f"Available agents: {', '.join(_AGENT_SPECS.keys())}")
                 return
             
             logger.info(f"Running single agent: {args.agent}")
-            agent = agents[args.agent]
+            agent = build_agents(api_client, only=args.agent)[args.agent]
             result = await agent.execute({})
             
             logger.info("Agent execution complete")
             logger.info(f"Result preview: {str(result)[:200]}...")
             
             # Save the result
-            await save_result(args.agent, result)
+            await save_result(args.agent, result, run_timestamp)
             return
         
         # Otherwise run full orchestrated analysis
+        agents = build_agents(api_client)
+        logger.info(f"✓ Initialized {len(agents)} agents")
+
         master = MasterOpportunityAgent(api_client, agents)
         
         logger.info("\nStarting full opportunity mapping analysis...")
@@ -167,7 +193,6 @@ async def main():
         
         # Show archive information
         logger.info("\n📚 Archive Management:")
-        archive_mgr = ArchiveManager()
         archives = archive_mgr.list_archives()
         logger.info(f"  Total archived runs: {len(archives)}")
         logger.info(f"  Latest outputs in: outputs/reports/")
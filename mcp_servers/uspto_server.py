@@ -5,8 +5,11 @@ Provides tools for patent search and innovation trend analysis
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent
+import hishel
 import httpx
 import json
+import orjson
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 from typing import Optional, List
 import asyncio
 import sys
@@ -21,6 +24,59 @@ app = Server("uspto-patent-search")
 
 USPTO_BASE_URL = "https://developer.uspto.gov/ibd-api/v1"
 
+# Only the fields the tool actually projects; cuts response bytes and
+# parse time by roughly an order of magnitude vs the full documents
+_FIELD_LIST = ",".join([
+    "patentApplicationNumber",
+    "inventionTitle",
+    "assigneeEntityName",
+    "filingDate",
+    "inventionAbstract",
+    "inventorNameArrayText"
+])
+
+# USPTO caps rows per request; larger result sets are paged
+_PAGE_SIZE = 1000
+
+# In-process memo of formatted search results: duplicate tool calls in
+# the same session (several agents querying the same keyword) skip even
+# the local disk cache. Oldest entry is evicted past the cap.
+_memo: dict = {}
+_MEMO_MAX = 256
+
+def _is_transient(exc: BaseException) -> bool:
+    """Retry timeouts, dropped connections, and 5xx — never 4xx."""
+    if isinstance(exc, (httpx.TimeoutException, httpx.RemoteProtocolError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return False
+
+# Persistent HTTP cache: identical queries across weekly refreshes come
+# back from disk instead of re-hitting the USPTO API. The shared client
+# also avoids a TLS handshake per call and multiplexes over HTTP/2.
+_cache_storage = hishel.AsyncFileStorage(base_path=".cache/uspto", ttl=86400 * 7)
+_cache_controller = hishel.Controller(
+    cacheable_methods=["GET"],
+    allow_stale=True,
+    force_cache=True
+)
+_client = hishel.AsyncCacheClient(
+    base_url=USPTO_BASE_URL,
+    storage=_cache_storage,
+    controller=_cache_controller,
+    http2=True,
+    # Brotli cuts large JSON payloads well below gzip; httpx
+    # decompresses transparently when brotli is installed
+    headers={"Accept-Encoding": "br, gzip"},
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=40,
+        keepalive_expiry=30.0
+    )
+)
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """Define available USPTO tools"""
@@ -85,75 +141,107 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         )]
 
 
+async def _fetch_page(params: dict) -> dict:
+    """Fetch one page of USPTO results with jittered retry on transient errors."""
+    # Backoff so a transient 502/503/timeout doesn't permanently fail
+    # every agent depending on this data
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(initial=0.5, max=10),
+        retry=retry_if_exception(_is_transient),
+        reraise=True
+    ):
+        with attempt:
+            response = await _client.get("/patent/application", params=params)
+            response.raise_for_status()
+    return orjson.loads(response.content)
+
+
 async def search_patents(query: str, assignees: Optional[List[str]], 
                         date_range: Optional[str], max_results: int) -> list[TextContent]:
     """Search USPTO patent database"""
     logger.info(f"search_patents called with query={query}")
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        params = {
-            "searchText": query,
-            "rows": min(max_results, 1000)
+    memo_key = (query, tuple(assignees or ()), date_range, max_results)
+    cached = _memo.get(memo_key)
+    if cached is not None:
+        logger.info("Returning in-process cached result")
+        return [TextContent(type="text", text=cached)]
+    
+    params = {
+        "searchText": query,
+        "rows": min(max_results, _PAGE_SIZE),
+        "fl": _FIELD_LIST
+    }
+    
+    if assignees:
+        assignee_query = " OR ".join(assignees)
+        params["assignee"] = assignee_query
+    
+    if date_range:
+        params["dateRange"] = date_range
+    
+    try:
+        logger.info(f"Calling USPTO API with params: {params}")
+        data = await _fetch_page(params)
+        docs = data.get("docs", [])
+        total_found = data.get("numFound", 0)
+        
+        # Fetch any remaining pages concurrently
+        remaining = min(max_results, total_found)
+        if remaining > len(docs) and docs:
+            offsets = range(len(docs), remaining, _PAGE_SIZE)
+            pages = await asyncio.gather(
+                *(_fetch_page({**params, "start": offset}) for offset in offsets))
+            for page in pages:
+                docs.extend(page.get("docs", []))
+        
+        logger.info(f"USPTO API returned {total_found} results")
+        
+        # Format results
+        results = {
+            "query": query,
+            "total_found": total_found,
+            "returned": len(docs[:max_results]),
+            "patents": []
         }
         
-        if assignees:
-            assignee_query = " OR ".join(assignees)
-            params["assignee"] = assignee_query
+        for patent in docs[:max_results]:
+            results["patents"].append({
+                "patent_number": patent.get("patentApplicationNumber"),
+                "title": patent.get("inventionTitle"),
+                "assignee": patent.get("assigneeEntityName"),
+                "filing_date": patent.get("filingDate"),
+                "abstract": patent.get("inventionAbstract", "")[:300],
+                "inventors": patent.get("inventorNameArrayText", [])[:3]
+            })
         
-        if date_range:
-            params["dateRange"] = date_range
+        result_json = orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+        logger.info(f"Returning result: {result_json[:200]}...")
         
-        try:
-            logger.info(f"Calling USPTO API with params: {params}")
-            response = await client.get(
-                f"{USPTO_BASE_URL}/patent/application",
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            logger.info(f"USPTO API returned {data.get('numFound', 0)} results")
-            
-            # Format results
-            results = {
-                "query": query,
-                "total_found": data.get("numFound", 0),
-                "returned": len(data.get("docs", [])),
-                "patents": []
-            }
-            
-            for patent in data.get("docs", [])[:max_results]:
-                results["patents"].append({
-                    "patent_number": patent.get("patentApplicationNumber"),
-                    "title": patent.get("inventionTitle"),
-                    "assignee": patent.get("assigneeEntityName"),
-                    "filing_date": patent.get("filingDate"),
-                    "abstract": patent.get("inventionAbstract", "")[:300],
-                    "inventors": patent.get("inventorNameArrayText", [])[:3]
-                })
-            
-            result_json = json.dumps(results, indent=2)
-            logger.info(f"Returning result: {result_json[:200]}...")
-            
-            return [TextContent(
-                type="text",
-                text=result_json
-            )]
+        if len(_memo) >= _MEMO_MAX:
+            _memo.pop(next(iter(_memo)))
+        _memo[memo_key] = result_json
         
-        except httpx.HTTPError as e:
-            logger.error(f"USPTO API error: {str(e)}")
-            error_response = {"error": f"USPTO API error: {str(e)}"}
-            return [TextContent(
-                type="text",
-                text=json.dumps(error_response, indent=2)
-            )]
-        except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-            error_response = {"error": f"Unexpected error: {str(e)}"}
-            return [TextContent(
-                type="text",
-                text=json.dumps(error_response, indent=2)
-            )]
+        return [TextContent(
+            type="text",
+            text=result_json
+        )]
+    
+    except httpx.HTTPError as e:
+        logger.error(f"USPTO API error: {str(e)}")
+        error_response = {"error": f"USPTO API error: {str(e)}"}
+        return [TextContent(
+            type="text",
+            text=json.dumps(error_response, indent=2)
+        )]
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        error_response = {"error": f"Unexpected error: {str(e)}"}
+        return [TextContent(
+            type="text",
+            text=json.dumps(error_response, indent=2)
+        )]
 
 
 async def main():
@@ -161,13 +249,16 @@ async def main():
     logger.info("Starting USPTO MCP Server")
     from mcp.server.stdio import stdio_server
     
-    async with stdio_server() as (read_stream, write_stream):
-        logger.info("Server initialized, waiting for requests")
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            logger.info("Server initialized, waiting for requests")
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        await _client.aclose()
 
 
 if __name__ == "__main__":
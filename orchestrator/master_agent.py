@@ -1,13 +1,56 @@
 """Master orchestration agent for ADAS Opportunity Mapping."""
 
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
+import os
+import time
+import traceback
+from contextvars import ContextVar
+
+import aiofiles
+import orjson
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 import json
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+def load_summary(path) -> Dict[str, Any]:
+    """Replay an incremental .jsonl summary into the classic dict shape.
+    
+    Useful for inspecting runs that crashed before the final summary
+    JSON was written.
+    """
+    metadata = {}
+    execution_log = []
+    with open(path, 'rb') as f:
+        for line in f:
+            entry = orjson.loads(line)
+            if '_metadata' in entry:
+                metadata = entry['_metadata']
+            else:
+                execution_log.append(entry)
+    return {'metadata': metadata, 'execution_log': execution_log}
+
+# Active MCP client pool for the current run. Tasks spawned by
+# asyncio.gather inherit the context, so agents can call
+# get_mcp_pool() instead of threading client dicts through `context`
+# (which also risks JSON-encoding live client objects).
+_mcp_pool: ContextVar[Dict[str, Any]] = ContextVar('mcp_pool', default={})
+
+def get_mcp_pool() -> Dict[str, Any]:
+    """Return the MCP clients for the run currently executing."""
+    return _mcp_pool.get()
+
+# (data_sources key, value marking an API hit, usage counter, display label)
+_API_SOURCE_MAP = (
+    ('patent_data', 'uspto_api', 'uspto_calls', 'USPTO'),
+    ('github_issues', 'github_api', 'github_calls', 'GitHub'),
+    ('academic_papers', 'semantic_scholar_api', 'semantic_scholar_calls', 'Semantic Scholar'),
+)
+
 class MasterOpportunityAgent:
     """Orchestrates the execution of all opportunity mapping agents.
     
@@ -17,7 +60,8 @@ class MasterOpportunityAgent:
     - Fallback handling when APIs unavailable
     """
     
-    def __init__(self, api_client, agents: Dict[str, Any], mcp_clients: Optional[Dict[str, Any]] = None):
+    def __init__(self, api_client, agents: Dict[str, Any], mcp_clients: Optional[Dict[str, Any]] = None,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the master agent.
         
@@ -25,10 +69,24 @@ class MasterOpportunityAgent:
             api_client: Anthropic API client
             agents: Dictionary of agent instances
             mcp_clients: Optional dictionary of MCP clients (uspto, github, semantic_scholar)
+            cache_dir: Optional directory for the agent result cache; when set,
+                an agent whose inputs are unchanged since a previous run is
+                answered from disk instead of re-invoking the LLM
         """
         self.api_client = api_client
         self.agents = agents
         self.mcp_clients = mcp_clients or {}
+        self._output_dir = Path("outputs/reports")
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Concurrency caps: keep parallel agents inside the Anthropic
+        # RPM/TPM budget (429 backoff costs far more than queueing) and
+        # stop agents from independently saturating the MCP APIs
+        self._llm_sem = asyncio.Semaphore(int(os.getenv('ADAS_MAX_CONCURRENCY', '5')))
+        self._mcp_sem = asyncio.Semaphore(8)
         
         # Log MCP client availability
         self._log_mcp_status()
@@ -46,6 +104,79 @@ class MasterOpportunityAgent:
             'positioning_messaging',
             'visualization_reporting'
         ]
+        
+        # Dependency DAG, inferred from the context keys each agent reads.
+        # Agents in the same topological wave run concurrently since LLM
+        # and MCP calls are I/O-bound.
+        self.dependencies = {
+            'source_discovery': [],
+            'market_size': ['source_discovery'],
+            'trends_simplification': ['market_size'],
+            'competitive_landscape': ['source_discovery'],
+            'pain_point_extraction': ['source_discovery'],
+            'compute_architecture': ['trends_simplification', 'pain_point_extraction'],
+            'bottleneck_diagnosis': ['competitive_landscape', 'pain_point_extraction',
+                                     'compute_architecture'],
+            'gap_analysis': ['market_size', 'trends_simplification', 'competitive_landscape',
+                             'pain_point_extraction', 'bottleneck_diagnosis'],
+            'positioning_messaging': ['gap_analysis'],
+            'visualization_reporting': ['market_size', 'trends_simplification', 'gap_analysis'],
+        }
+        # Freeze the execution plan once: missing agents are warned about
+        # here, and runs iterate waves already filtered to what exists
+        self._missing = [name for name in self.execution_order if name not in self.agents]
+        for name in self._missing:
+            logger.warning(f"Agent '{name}' not found in initialized agents")
+        self._waves = [tuple(name for name in wave if name in self.agents)
+                       for wave in self._topo_waves()]
+        self._waves = [wave for wave in self._waves if wave]
+    
+    def _topo_waves(self) -> List[List[str]]:
+        """Group agents into topological waves of mutually independent agents."""
+        remaining = [name for name in self.execution_order]
+        done = set()
+        waves = []
+        
+        while remaining:
+            wave = [name for name in remaining
+                    if all(dep in done for dep in self.dependencies.get(name, []))]
+            if not wave:
+                # Cycle or missing dependency; fall back to sequential order
+                waves.extend([name] for name in remaining)
+                break
+            waves.append(wave)
+            done.update(wave)
+            remaining = [name for name in remaining if name not in wave]
+        
+        return waves
+    
+    def _cache_key(self, agent_name: str, context: Dict[str, Any]) -> str:
+        """Hash an agent's name plus the slice of context it actually reads."""
+        subset = {f'{dep}_data': context.get(f'{dep}_data', {})
+                  for dep in self.dependencies.get(agent_name, [])}
+        payload = json.dumps({'agent': agent_name, 'context': subset},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _cache_lookup(self, agent_name: str, context: Dict[str, Any]) -> Optional[dict]:
+        """Return a cached result for unchanged inputs, or None."""
+        cache_file = self.cache_dir / f"{agent_name}_{self._cache_key(agent_name, context)}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            with open(cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _cache_store(self, agent_name: str, context: Dict[str, Any], result: dict):
+        """Persist an agent result under its input hash."""
+        cache_file = self.cache_dir / f"{agent_name}_{self._cache_key(agent_name, context)}.json"
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump(result, f, default=str)
+        except OSError as e:
+            logger.warning(f"Could not write agent cache for {agent_name}: {e}")
     
     def _log_mcp_status(self):
         """Log which MCP clients are available"""
@@ -70,24 +201,21 @@ class MasterOpportunityAgent:
         
         logger.info("=" * 80 + "\n")
     
-    def _save_agent_result(self, agent_name: str, result: dict, timestamp: str):
-        """Save individual agent result to separate file."""
-        output_dir = Path("outputs/reports")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        output_file = output_dir / f"{agent_name}_result_{timestamp}.json"
-        
-        # Custom JSON encoder for datetime
-        class DateTimeEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                return super().default(obj)
+    async def _append_summary_line(self, path: Path, entry: dict):
+        """Append one JSONL line so a crash mid-run still leaves a summary."""
+        async with aiofiles.open(path, 'ab') as f:
+            await f.write(orjson.dumps(entry, option=orjson.OPT_NAIVE_UTC) + b'\n')
+    
+    async def _save_agent_result(self, agent_name: str, result: dict, timestamp: str):
+        """Save individual agent result without blocking the event loop."""
+        output_file = self._output_dir / f"{agent_name}_result_{timestamp}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2, cls=DateTimeEncoder)
+        # orjson serializes datetime natively, no custom encoder needed
+        data = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+        async with aiofiles.open(output_file, 'wb') as f:
+            await f.write(data)
         
-        logger.info(f"✅ Saved {agent_name} result to {output_file}")
+        logger.info("Saved %s result to %s", agent_name, output_file)
     
     async def run_full_analysis(self) -> Dict[str, Any]:
         """
@@ -101,89 +229,155 @@ class MasterOpportunityAgent:
         
         start_time = datetime.now()
         timestamp = start_time.strftime("%Y%m%d_%H%M%S")
+        # Monotonic origin for per-agent log offsets; wall clock is only
+        # read once at the start and once at the end
+        t0 = time.perf_counter_ns()
         
         context = {
             'start_time': start_time,
             'timestamp': timestamp,
-            'mcp_clients': self.mcp_clients  # Pass MCP clients to context
+            'mcp_sem': self._mcp_sem  # Shared cap on concurrent MCP calls
         }
         
+        summary_jsonl = self._output_dir / f"execution_summary_{timestamp}.jsonl"
+        
         results = {}
         execution_log = []
         agents_executed = 0
         agents_failed = 0
+        agents_skipped = 0
+        failed = set()
         api_usage_stats = {
             'uspto_calls': 0,
             'github_calls': 0,
             'semantic_scholar_calls': 0
         }
         
-        for agent_name in self.execution_order:
-            if agent_name not in self.agents:
-                logger.warning(f"Agent '{agent_name}' not found in initialized agents")
-                continue
-            
-            logger.info("=" * 80)
-            logger.info(f"EXECUTING: {agent_name}")
-            logger.info("=" * 80)
-            
+        async def _run_agent(agent_name: str):
+            """Execute one agent, track its API usage, and save its result."""
+            logger.info("agent=%s status=start", agent_name)
+
             try:
                 agent = self.agents[agent_name]
-                
-                # Execute agent with current context
-                agent_result = await agent.execute(context)
-                
+
+                # Answer from the result cache when this agent's inputs
+                # are identical to a previous run; otherwise execute
+                agent_result = self._cache_lookup(agent_name, context) if self.cache_dir else None
+                if agent_result is not None:
+                    logger.info("agent=%s status=cache_hit", agent_name)
+                else:
+                    async with self._llm_sem:
+                        agent_result = await agent.execute(context)
+                    if self.cache_dir:
+                        self._cache_store(agent_name, context, agent_result)
+
                 # Track API usage if available
                 data_sources = agent_result.get('data_sources', {})
-                if data_sources.get('patent_data') == 'uspto_api':
-                    api_usage_stats['uspto_calls'] += 1
-                    logger.info("  📊 Used USPTO Patent API")
-                
-                if data_sources.get('github_issues') == 'github_api':
-                    api_usage_stats['github_calls'] += 1
-                    logger.info("  📊 Used GitHub API")
-                
-                if data_sources.get('academic_papers') == 'semantic_scholar_api':
-                    api_usage_stats['semantic_scholar_calls'] += 1
-                    logger.info("  📊 Used Semantic Scholar API")
-                
-                # Store result in context for next agents
-                context[f'{agent_name}_data'] = agent_result
+                used = []
+                for key, expected, counter, label in _API_SOURCE_MAP:
+                    if data_sources.get(key) == expected:
+                        api_usage_stats[counter] += 1
+                        used.append(label)
+
                 results[agent_name] = agent_result
-                
-                # Save individual agent result immediately
-                self._save_agent_result(agent_name, agent_result, timestamp)
-                
+
+                # Save immediately; the disk write overlaps sibling agents
+                await self._save_agent_result(agent_name, agent_result, timestamp)
+
                 # Log execution
-                execution_log.append({
+                log_entry = {
                     'agent': agent_name,
-                    'timestamp': datetime.now(),
+                    'elapsed_ns': time.perf_counter_ns() - t0,
                     'success': True,
                     'confidence': agent_result.get('confidence', 'Unknown'),
                     'data_sources': data_sources
-                })
-                
-                agents_executed += 1
-                logger.info(f"✅ {agent_name} completed successfully")
-                logger.info(f"   Confidence: {agent_result.get('confidence', 'Unknown')}\n")
-                
+                }
+                execution_log.append(log_entry)
+                await self._append_summary_line(summary_jsonl, log_entry)
+
+                # One structured line per agent; % args stay unformatted
+                # if the level is filtered out
+                logger.info("agent=%s status=ok conf=%s srcs=%s",
+                            agent_name, log_entry['confidence'], used)
+                return agent_name, agent_result
+
             except Exception as e:
-                logger.error(f"❌ {agent_name} failed: {str(e)}", exc_info=True)
-                execution_log.append({
+                # Capture the traceback once; only re-emit it to the log
+                # stream when DEBUG is on
+                tb = traceback.format_exc()
+                logger.error("agent=%s failed: %s", agent_name, e,
+                             exc_info=logger.isEnabledFor(logging.DEBUG))
+                log_entry = {
                     'agent': agent_name,
-                    'timestamp': datetime.now(),
+                    'elapsed_ns': time.perf_counter_ns() - t0,
                     'success': False,
                     'error': str(e)
-                })
-                agents_failed += 1
-                
-                # Continue with next agent even if one fails
-                context[f'{agent_name}_data'] = {}
-                results[agent_name] = {'error': str(e)}
+                }
+                execution_log.append(log_entry)
+                await self._append_summary_line(summary_jsonl, log_entry)
+
+                # Downstream agents continue with an empty-dict fallback;
+                # the per-agent file keeps full debuggability
+                results[agent_name] = {'error': str(e), 'traceback': tb}
+                await self._save_agent_result(agent_name, results[agent_name], timestamp)
+                return agent_name, None
+
+        # Expose the MCP pool for the duration of the run
+        pool_token = _mcp_pool.set(self.mcp_clients)
+        
+        # Execute the dependency DAG wave by wave; agents within a wave
+        # are mutually independent and run concurrently
+        for wave in self._waves:
+            # Skip agents whose upstream data is missing rather than pay a
+            # full LLM call to reason over empty input. Waves are
+            # topological, so adding a skipped agent to the failed set
+            # propagates the skip transitively.
+            runnable = []
+            for name in wave:
+                if any(dep in failed for dep in self.dependencies.get(name, [])):
+                    failed.add(name)
+                    agents_skipped += 1
+                    logger.warning("agent=%s status=skipped reason=upstream_failed", name)
+                    log_entry = {
+                        'agent': name,
+                        'elapsed_ns': time.perf_counter_ns() - t0,
+                        'success': False,
+                        'skipped': True,
+                        'reason': 'upstream_failed'
+                    }
+                    execution_log.append(log_entry)
+                    await self._append_summary_line(summary_jsonl, log_entry)
+                    context[f'{name}_data'] = {}
+                    results[name] = {'error': 'skipped: upstream agent failed', 'skipped': True}
+                else:
+                    runnable.append(name)
+            
+            if not runnable:
+                continue
+            
+            wave_results = await asyncio.gather(*(_run_agent(name) for name in runnable))
+
+            # Merge the wave's outputs into context before the next wave starts
+            for agent_name, agent_result in wave_results:
+                if agent_result is not None:
+                    context[f'{agent_name}_data'] = agent_result
+                    agents_executed += 1
+                else:
+                    failed.add(agent_name)
+                    context[f'{agent_name}_data'] = {}
+                    agents_failed += 1
+        
+        _mcp_pool.reset(pool_token)
         
         end_time = datetime.now()
         execution_time = (end_time - start_time).total_seconds()
         
+        # Derive wall-clock timestamps from the monotonic offsets once,
+        # keeping the log format the dashboard expects
+        for entry in execution_log:
+            offset_us = entry.pop('elapsed_ns') / 1000
+            entry['timestamp'] = (start_time + timedelta(microseconds=offset_us)).isoformat()
+        
         # Compile metadata with API usage
         metadata = {
             'execution_time_seconds': execution_time,
@@ -192,6 +386,7 @@ class MasterOpportunityAgent:
             'end_time': end_time,
             'agents_executed': agents_executed,
             'agents_failed': agents_failed,
+            'agents_skipped': agents_skipped,
             'apis_available': {
                 'uspto': self.mcp_clients.get('uspto') is not None,
                 'github': self.mcp_clients.get('github') is not None,
@@ -211,17 +406,25 @@ class MasterOpportunityAgent:
             }
         }
         
-        summary_file = Path("outputs/reports") / f"execution_summary_{timestamp}.json"
+        # Close out the incremental log, then write the classic summary
+        # JSON the dashboard globs for
+        await self._append_summary_line(summary_jsonl, {'_metadata': metadata})
         
-        class DateTimeEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                return super().default(obj)
-        
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2, cls=DateTimeEncoder)
+        summary_file = self._output_dir / f"execution_summary_{timestamp}.json"
         
+        with open(summary_file, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC))
+
+        # Write a small manifest pointing at this run so the dashboard can
+        # skip the directory glob entirely
+        manifest = {
+            'timestamp': timestamp,
+            'summary_file': summary_file.name,
+            'files': summary['results_files']
+        }
+        with open(self._output_dir / "latest.json", 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+
         logger.info("\n" + "=" * 80)
         logger.info("ANALYSIS COMPLETE")
         logger.info("=" * 80)
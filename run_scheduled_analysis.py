@@ -2,14 +2,18 @@
 
 import asyncio
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+try:
+    import uvloop
+except ImportError:  # Windows dev machines; default loop still works
+    uvloop = None
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from utils.api_client import AnthropicClient
 from orchestrator.master_agent import MasterOpportunityAgent
 
@@ -25,23 +29,39 @@ from agents.gap_analysis import GapAnalysisAgent
 from agents.positioning_messaging import PositioningMessagingAgent
 from agents.visualization_reporting import VisualizationReportingAgent
 
-def setup_logging():
-    """Configure logging for scheduled run."""
+def setup_logging() -> QueueListener:
+    """Configure logging for scheduled run.
+    
+    Handlers run on a QueueListener worker thread so log I/O never
+    blocks the event loop inside agent coroutines. The caller must
+    stop() the returned listener on shutdown. Re-invoking (e.g. from a
+    notebook) returns None instead of stacking duplicate handlers.
+    """
+    if logging.getLogger().handlers:
+        return None
+    
     log_dir = Path('logs')
     log_dir.mkdir(exist_ok=True)
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_dir / f'scheduled_{datetime.now().strftime("%Y%m%d")}.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # Size-based rotation bounds disk growth across cron invocations
+    file_handler = RotatingFileHandler(log_dir / 'scheduled.log',
+                                       maxBytes=50_000_000, backupCount=14)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    
+    listener = QueueListener(log_queue, file_handler, stream_handler,
+                             respect_handler_level=True)
+    listener.start()
+    return listener
 
 async def main():
     """Run scheduled analysis."""
-    setup_logging()
+    listener = setup_logging()
     logger = logging.getLogger('scheduled_analysis')
     
     logger.info("=" * 70)
@@ -57,41 +77,53 @@ async def main():
         api_client = AnthropicClient()
         logger.info("✓ API client initialized")
         
-        # Initialize all agents
-        agents = {
-            'source_discovery': SourceDiscoveryAgent(api_client),
-            'market_size': MarketSizeAgent(api_client),
-            'trends_simplification': TrendsSimplificationAgent(api_client),
-            'competitive_landscape': CompetitiveLandscapeAgent(api_client),
-            'pain_point_extraction': PainPointExtractionAgent(api_client),
-            'compute_architecture': ComputeArchitectureAgent(api_client),
-            'bottleneck_diagnosis': BottleneckDiagnosisAgent(api_client),
-            'gap_analysis': GapAnalysisAgent(api_client),
-            'positioning_messaging': PositioningMessagingAgent(api_client),
-            'visualization_reporting': VisualizationReportingAgent(),
-        }
-        logger.info(f"✓ Initialized {len(agents)} agents")
+        try:
+            # Initialize all agents
+            agents = {
+                'source_discovery': SourceDiscoveryAgent(api_client),
+                'market_size': MarketSizeAgent(api_client),
+                'trends_simplification': TrendsSimplificationAgent(api_client),
+                'competitive_landscape': CompetitiveLandscapeAgent(api_client),
+                'pain_point_extraction': PainPointExtractionAgent(api_client),
+                'compute_architecture': ComputeArchitectureAgent(api_client),
+                'bottleneck_diagnosis': BottleneckDiagnosisAgent(api_client),
+                'gap_analysis': GapAnalysisAgent(api_client),
+                'positioning_messaging': PositioningMessagingAgent(api_client),
+                'visualization_reporting': VisualizationReportingAgent(),
+            }
+            logger.info(f"✓ Initialized {len(agents)} agents")
         
-        # Run full analysis
-        master = MasterOpportunityAgent(api_client, agents)
-        logger.info("Starting full opportunity mapping analysis...")
+            # Run full analysis
+            master = MasterOpportunityAgent(api_client, agents)
+            logger.info("Starting full opportunity mapping analysis...")
         
-        results = await master.run_full_analysis()
+            results = await master.run_full_analysis()
         
-        # Print summary
-        logger.info("\n" + "=" * 70)
-        logger.info("SCHEDULED ANALYSIS COMPLETE")
-        logger.info("=" * 70)
-        logger.info(f"Execution time: {results['metadata']['execution_time_seconds']:.2f}s")
-        logger.info(f"Agents succeeded: {results['metadata']['agents_executed']}")
-        logger.info(f"Agents failed: {results['metadata']['agents_failed']}")
+            # Print summary
+            logger.info("\n" + "=" * 70)
+            logger.info("SCHEDULED ANALYSIS COMPLETE")
+            logger.info("=" * 70)
+            logger.info(f"Execution time: {results['metadata']['execution_time_seconds']:.2f}s")
+            logger.info(f"Agents succeeded: {results['metadata']['agents_executed']}")
+            logger.info(f"Agents failed: {results['metadata']['agents_failed']}")
         
-        logger.info("\n📄 Results saved to outputs/reports/")
-        logger.info("Dashboard will auto-update on next Streamlit Cloud refresh")
+            logger.info("\n📄 Results saved to outputs/reports/")
+            logger.info("Dashboard will auto-update on next Streamlit Cloud refresh")
+        finally:
+            # Drain the SDK's pooled HTTP connections
+            await api_client.aclose()
         
     except Exception as e:
         logger.error(f"Scheduled analysis failed: {str(e)}", exc_info=True)
         sys.exit(1)
+    finally:
+        # Flush queued records before the process exits
+        if listener is not None:
+            listener.stop()
 
 if __name__ == "__main__":
+    if uvloop is not None and sys.platform != 'win32':
+        # libuv-backed loop: faster scheduling for the gathered agent
+        # coroutines and their USPTO sub-queries
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
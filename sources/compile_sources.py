@@ -0,0 +1,36 @@
+"""Precompile allowed_sources.json into a pickle for fast loading.
+
+Run after editing allowed_sources.json (or from a build step):
+
+    python -m sources.compile_sources
+
+SourceRules loads the pickle when it is newer than the JSON, skipping
+the JSON parse and the config flattening on every construction.
+"""
+
+import pickle
+
+import orjson
+from pathlib import Path
+
+_SOURCES_DIR = Path(__file__).parent
+
+
+def compile_sources(config_path: Path = None, output_path: Path = None) -> Path:
+    """Serialize the parsed config with highest-protocol pickle."""
+    if config_path is None:
+        config_path = _SOURCES_DIR / 'allowed_sources.json'
+    if output_path is None:
+        output_path = _SOURCES_DIR / 'allowed_sources.pkl'
+
+    with open(config_path, 'rb') as f:
+        config = orjson.loads(f.read())
+
+    with open(output_path, 'wb') as f:
+        pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return output_path
+
+
+if __name__ == '__main__':
+    print(f"Compiled to {compile_sources()}")
@@ -1,57 +1,162 @@
 """Source validation rules engine."""
 
-import json
+import atexit
+import pickle
+import re
+from collections import Counter
+from types import MappingProxyType
+
+import numpy as np
+import orjson
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup; plain substring scans still work
+    ahocorasick = None
 
 class SourceRules:
     """Enforces source quality and validation rules."""
     
+    # No per-instance __dict__; the attribute set is fixed and small
+    __slots__ = ('config', '_domain_entries', '_excluded_re',
+                 '_domain_automaton', '_excluded_automaton', '_hit_counter')
+    
     def __init__(self, config_path: str = None):
         if config_path is None:
             config_path = Path(__file__).parent / 'allowed_sources.json'
         
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        # Read-only view: validation must never mutate the shared config
+        raw = self._load_config(Path(config_path))
+        self.config = MappingProxyType({
+            key: MappingProxyType(value) if isinstance(value, dict) else value
+            for key, value in raw.items()
+        })
+        
+        # Flatten the nested config once into (domain, category, source)
+        # so lookups don't re-walk four levels of dicts per URL; order by
+        # hit frequency from previous runs so the common case matches on
+        # the first few entries
+        self._domain_entries = list(self._iter_domain_entries())
+        self._hit_counter = Counter()
+        stats = self._load_hit_stats()
+        if stats:
+            self._domain_entries.sort(key=lambda entry: -stats.get(entry[0], 0))
+        
+        # With pyahocorasick available, all domains (and all excluded
+        # patterns) are matched in a single C-level pass over the URL
+        # Fallback matcher: one alternation scan instead of a Python
+        # loop over N substring tests (patterns are literal fragments,
+        # so the escaped match text is the pattern itself)
+        self._excluded_re = re.compile(
+            '|'.join(re.escape(p) for p in self.config['excluded_patterns']))
+        
+        self._domain_automaton = None
+        self._excluded_automaton = None
+        if ahocorasick is not None:
+            self._domain_automaton = ahocorasick.Automaton()
+            for domain, category, source in self._domain_entries:
+                self._domain_automaton.add_word(domain, (domain, category, source))
+            self._domain_automaton.make_automaton()
+            
+            self._excluded_automaton = ahocorasick.Automaton()
+            for pattern in self.config['excluded_patterns']:
+                self._excluded_automaton.add_word(pattern, pattern)
+            self._excluded_automaton.make_automaton()
     
-    def is_allowed_domain(self, url: str) -> Tuple[bool, str, str]:
-        """
-        Check if URL is from an allowed domain.
+    @staticmethod
+    def _hit_stats_path() -> Path:
+        return Path(__file__).parent / 'hit_stats.json'
+    
+    def _load_hit_stats(self) -> Dict[str, int]:
+        """Domain hit counts persisted by previous runs (empty if none)."""
+        try:
+            with open(self._hit_stats_path(), 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+    
+    def save_hit_stats(self):
+        """Merge this run's domain hits into sources/hit_stats.json."""
+        if not self._hit_counter:
+            return
+        stats = Counter(self._load_hit_stats())
+        stats.update(self._hit_counter)
+        with open(self._hit_stats_path(), 'wb') as f:
+            f.write(orjson.dumps(dict(stats), option=orjson.OPT_INDENT_2))
+    
+    @staticmethod
+    def _load_config(config_path: Path) -> Dict:
+        """Load the config, preferring the precompiled pickle when fresh.
         
-        Returns:
-            (is_allowed, category, specific_source)
+        sources/compile_sources.py writes the pickle; it is only used
+        when newer than the JSON so edits are never silently ignored.
         """
-        url_lower = url.lower()
+        pkl_path = config_path.with_suffix('.pkl')
+        try:
+            if pkl_path.stat().st_mtime >= config_path.stat().st_mtime:
+                with open(pkl_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError):
+            pass
         
-        # Check academic sources
+        with open(config_path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    def _iter_domain_entries(self):
+        """Yield every allowed domain with its category and source name."""
         for source_name, source_info in self.config['academic'].items():
             for domain in source_info['domains']:
-                if domain in url_lower:
-                    return True, 'academic', source_name
-        
-        # Check financial research
+                yield domain, 'academic', source_name
         for source_name, source_info in self.config['financial_research'].items():
             for domain in source_info['domains']:
-                if domain in url_lower:
-                    return True, 'financial_research', source_name
-        
-        # Check semiconductor vendors
+                yield domain, 'financial_research', source_name
         for vendor, domains in self.config['industry']['semiconductor_vendors'].items():
             for domain in domains:
-                if domain in url_lower:
-                    return True, 'semiconductor_vendor', vendor
-        
-        # Check OEMs
+                yield domain, 'semiconductor_vendor', vendor
         for oem, domains in self.config['industry']['oems'].items():
             for domain in domains:
-                if domain in url_lower:
-                    return True, 'oem', oem
-        
-        # Check Tier-1 suppliers
+                yield domain, 'oem', oem
         for tier1, domains in self.config['industry']['tier1'].items():
             for domain in domains:
-                if domain in url_lower:
-                    return True, 'tier1', tier1
+                yield domain, 'tier1', tier1
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _prepare(url: str) -> Tuple[str, str]:
+        """Split and lowercase a URL once, memoized across repeated citations.
+        
+        Returns:
+            (netloc, netloc + path) — domain rules match the netloc so a
+            path segment can't fake an allowed host; excluded patterns
+            match netloc+path since some span both (linkedin.com/pulse).
+        """
+        parts = urlsplit(url.lower())
+        netloc = parts.netloc or parts.path.split('/', 1)[0]
+        return netloc, parts.netloc + parts.path
+    
+    def is_allowed_domain(self, url: str) -> Tuple[bool, str, str]:
+        """
+        Check if URL is from an allowed domain.
+        
+        Returns:
+            (is_allowed, category, specific_source)
+        """
+        netloc, _ = self._prepare(url)
+        
+        if self._domain_automaton is not None:
+            for _, (domain, category, source) in self._domain_automaton.iter(netloc):
+                self._hit_counter[domain] += 1
+                return True, category, source
+            return False, '', ''
+        
+        for domain, category, source in self._domain_entries:
+            if domain in netloc:
+                self._hit_counter[domain] += 1
+                return True, category, source
         
         return False, '', ''
     
@@ -62,14 +167,51 @@ class SourceRules:
         Returns:
             (is_excluded, matched_pattern)
         """
-        url_lower = url.lower()
+        _, host_and_path = self._prepare(url)
         
-        for pattern in self.config['excluded_patterns']:
-            if pattern in url_lower:
+        if self._excluded_automaton is not None:
+            for _, pattern in self._excluded_automaton.iter(host_and_path):
                 return True, pattern
+            return False, ''
+        
+        match = self._excluded_re.search(host_and_path)
+        if match:
+            return True, match.group(0)
         
         return False, ''
     
+    def validate_many(self, urls: List[str]) -> np.ndarray:
+        """Validate URLs in bulk into a columnar structured array.
+        
+        One preallocated array instead of a dict per citation; intended
+        for report post-processing where citations arrive by the
+        hundreds.
+        
+        Returns:
+            Structured array with fields valid, category, source,
+            credibility (empty strings when invalid).
+        """
+        out = np.empty(len(urls), dtype=[('valid', '?'), ('category', 'U24'),
+                                         ('source', 'U32'), ('credibility', 'U8')])
+        
+        for i, url in enumerate(urls):
+            if not url or self.is_excluded(url)[0]:
+                out[i] = (False, '', '', '')
+                continue
+            
+            is_allowed, category, source = self.is_allowed_domain(url)
+            if not is_allowed:
+                out[i] = (False, '', '', '')
+                continue
+            
+            if category in ('academic', 'financial_research'):
+                credibility = self.config[category][source]['credibility']
+            else:
+                credibility = 'medium'
+            out[i] = (True, category, source, credibility)
+        
+        return out
+    
     def validate_citation(self, citation: Dict) -> Dict:
         """
         Validate a complete citation.
@@ -122,4 +264,16 @@ class SourceRules:
             if field not in citation or not citation[field]:
                 result['warnings'].append(f"Missing recommended field: {field}")
         
-        return result
\ No newline at end of file
+        return result
+
+
+@lru_cache(maxsize=1)
+def get_default_rules() -> "SourceRules":
+    """Process-wide SourceRules built from the bundled config.
+    
+    Hit stats are flushed at interpreter exit so the next run can
+    order its domain entries by observed frequency.
+    """
+    rules = SourceRules()
+    atexit.register(rules.save_hit_stats)
+    return rules
@@ -0,0 +1,22 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+# Manual setup-verification script, not a test module: it calls
+# exit(1) at import when no .env exists, which kills collection
+collect_ignore = ["test_setup.py"]
+
+from sources.source_rules import SourceRules
+from utils.source_validator import SourceValidator
+
+
+@pytest.fixture(scope="session")
+def rules():
+    """One SourceRules for the whole session; config is loaded once."""
+    return SourceRules()
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """One SourceValidator for the whole session."""
+    return SourceValidator()
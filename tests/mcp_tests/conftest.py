@@ -0,0 +1,47 @@
+"""Fixtures for USPTO tests.
+
+The fast test set replays canned responses through httpx.MockTransport;
+anything that hits the live API is marked integration and excluded from
+the default pytest run.
+"""
+
+import httpx
+import pytest
+
+SEARCH_FIXTURE = {
+    "numFound": 128,
+    "docs": [
+        {
+            "patentApplicationNumber": "US2024123456",
+            "inventionTitle": "Multi-sensor fusion system for autonomous vehicles",
+            "assigneeEntityName": "NVIDIA Corporation",
+            "filingDate": "2024-03-15",
+            "inventionAbstract": "A system and method for fusing sensor data from cameras and radar...",
+            "inventorNameArrayText": ["John Smith", "Jane Doe"]
+        }
+    ]
+}
+
+
+def _canned_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=SEARCH_FIXTURE)
+
+
+@pytest.fixture
+def mock_uspto(monkeypatch):
+    """Route USPTO clients through a canned MockTransport.
+
+    Matches the factory semantics of get_uspto_client: every call gets
+    a fresh client, so code that closes its client per invocation
+    keeps working.
+    """
+    from utils import http
+
+    def _make_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=http.USPTO_BASE_URL,
+            transport=httpx.MockTransport(_canned_handler)
+        )
+
+    monkeypatch.setattr(http, 'get_uspto_client', _make_client)
+    return _make_client()
@@ -2,13 +2,12 @@
 Test USPTO MCP Integration
 """
 
-import sys
-sys.path.append('.')
-
 from utils.mcp_clients.uspto_client import USPTOClient, quick_search
 import json
+import pytest
 
 
+@pytest.mark.integration
 def test_basic_search():
     """Test 1: Basic patent search"""
     print("=" * 80)
@@ -34,6 +33,7 @@ def test_basic_search():
     return results
 
 
+@pytest.mark.integration
 def test_trend_analysis():
     """Test 2: Innovation trend analysis"""
     print("\n" + "=" * 80)
@@ -66,6 +66,7 @@ def test_trend_analysis():
     return trends
 
 
+@pytest.mark.integration
 def test_white_space():
     """Test 3: White space identification"""
     print("\n" + "=" * 80)
@@ -2,12 +2,11 @@
 Simplified USPTO tests without full MCP server
 """
 
-import sys
-sys.path.append('.')
-
 import json
 from unittest.mock import Mock, patch, AsyncMock
 
+import pytest
+
 
 def test_mock_patent_search():
     """Test 1: Mock patent search (no real MCP server needed)"""
@@ -46,24 +45,45 @@ def test_mock_patent_search():
     return mock_response
 
 
+def test_mocked_api_call(mock_uspto, tmp_path, monkeypatch):
+    """Test 2a: client fan-out through the patched factory (offline)"""
+    from utils.mcp_clients.uspto_client import USPTOClient
+    
+    # Keep the client's disk cache inside the test sandbox
+    monkeypatch.chdir(tmp_path)
+    
+    with USPTOClient() as client:
+        result = client.find_white_space(['sensor fusion', 'lidar'], threshold=200)
+    
+    assert 'error' not in result
+    assert result['crowded_areas'] == []
+    counts = {e['technology']: e['patent_count'] for e in result['opportunities']}
+    assert counts == {'sensor fusion': 128, 'lidar': 128}
+
+
+@pytest.mark.integration
 def test_direct_api_call():
     """Test 2: Direct USPTO API call (no MCP)"""
     print("\n" + "=" * 80)
     print("TEST 2: Direct USPTO API Test")
     print("=" * 80)
     
-    import httpx
+    import asyncio
+    from utils.http import get_uspto_client
+    
+    async def _call():
+        # Client scoped to this loop; pooled for the duration of the call
+        async with get_uspto_client() as client:
+            return await client.get(
+                "/patent/application",
+                params={
+                    "searchText": "autonomous vehicle",
+                    "rows": 5
+                }
+            )
     
     try:
-        # Direct API call to USPTO
-        response = httpx.get(
-            "https://developer.uspto.gov/ibd-api/v1/patent/application",
-            params={
-                "searchText": "autonomous vehicle",
-                "rows": 5
-            },
-            timeout=30.0
-        )
+        response = asyncio.run(_call())
         
         if response.status_code == 200:
             data = response.json()
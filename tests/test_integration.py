@@ -7,6 +7,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Exercises the live Anthropic API when a key is configured; keep it
+# out of the default offline run
+pytestmark = pytest.mark.integration
+
 class TestIntegration:
     """Test full agent workflow."""
     
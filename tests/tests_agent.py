@@ -9,9 +9,7 @@ from sources.source_rules import SourceRules
 class TestSourceValidation:
     """Test source validation functionality."""
     
-    def test_allowed_domain(self):
-        rules = SourceRules()
-        
+    def test_allowed_domain(self, rules):
         # Test IEEE (should be allowed)
         is_allowed, category, source = rules.is_allowed_domain('https://ieeexplore.ieee.org/document/123')
         assert is_allowed == True
@@ -22,9 +20,7 @@ class TestSourceValidation:
         is_allowed, _, _ = rules.is_allowed_domain('https://medium.com/some-blog')
         assert is_allowed == False
     
-    def test_excluded_patterns(self):
-        rules = SourceRules()
-        
+    def test_excluded_patterns(self, rules):
         # Test blog exclusion
         is_excluded, pattern = rules.is_excluded('https://example.com/blog/post')
         assert is_excluded == True
@@ -33,9 +29,7 @@ class TestSourceValidation:
         is_excluded, _ = rules.is_excluded('https://ieee.org/paper')
         assert is_excluded == False
     
-    def test_citation_validation(self):
-        rules = SourceRules()
-        
+    def test_citation_validation(self, rules):
         valid_citation = {
             'url': 'https://ieee.org/paper/123',
             'claim': 'ADAS market growing at 15% CAGR',
@@ -46,12 +40,59 @@ class TestSourceValidation:
         assert result['valid'] == True
         assert result['source_category'] == 'academic'
 
+# Mixed inputs covering allowed, excluded, scheme-less, label-boundary
+# and unknown hosts; both batch paths must agree with the single-item
+# validators on every one of them
+URL_CASES = [
+    'https://ieeexplore.ieee.org/document/123',
+    'https://medium.com/some-post',
+    'https://example.com/blog/post',
+    'https://ti.com/doc',
+    'https://multi.com/doc',
+    'ieee.org/paper',
+    'https://unknown-domain.org/paper',
+    '',
+]
+
+
+class TestBatchEquivalence:
+    """Batch validators must agree with their single-item counterparts."""
+    
+    def test_validate_many_matches_validate_citation(self, rules):
+        results = rules.validate_many(URL_CASES)
+        for url, row in zip(URL_CASES, results):
+            single = rules.validate_citation(
+                {'url': url, 'claim': 'c', 'date_accessed': '2025-01-15'})
+            assert bool(row['valid']) == single['valid'], url
+            if row['valid']:
+                assert row['category'] == single['source_category'], url
+                assert row['source'] == single['source_name'], url
+    
+    def test_validate_batch_matches_validate_citation(self, validator):
+        citations = [
+            {'source': 's', 'url': url, 'date_accessed': '2025-01-15', 'claim': 'c'}
+            for url in URL_CASES
+        ]
+        # Missing-field shapes on top of the URL variety
+        citations.append({'source': 's', 'url': 'https://ieee.org/paper',
+                          'date_accessed': '2025-01-15'})
+        citations.append({'url': 'https://blog.nvidia.com/x', 'claim': 'c'})
+        
+        batch = validator.validate_batch(citations)
+        assert batch['total'] == len(citations)
+        assert batch['valid'] + batch['invalid'] == batch['total']
+        
+        for citation, detail in zip(citations, batch['details']):
+            single = validator.validate_citation(citation)
+            assert bool(detail['valid']) == single['valid'], citation
+            assert detail['missing_fields'] == single['missing_fields'], citation
+            assert bool(detail['url_valid']) == single['url_valid'], citation
+
+
 class TestSourceValidator:
     """Test SourceValidator class."""
     
-    def test_url_validation(self):
-        validator = SourceValidator()
-        
+    def test_url_validation(self, validator):
         # Test allowed URL
         is_valid, reason = validator.validate_url('https://ieee.org/paper')
         assert is_valid == True
@@ -59,5 +100,23 @@ class TestSourceValidator:
         # Test excluded URL
         is_valid, reason = validator.validate_url('https://medium.com/blog')
         assert is_valid == False
+    
+    def test_citation_required_fields(self, validator):
+        # A citation carrying all four required fields validates
+        citation = {
+            'source': 'IEEE Xplore',
+            'url': 'https://ieee.org/paper/123',
+            'date_accessed': '2025-01-15',
+            'claim': 'ADAS market growing at 15% CAGR'
+        }
+        result = validator.validate_citation(citation)
+        assert result['valid'] == True
+        assert result['missing_fields'] == []
+        
+        # A missing claim is reported by name
+        incomplete = {k: v for k, v in citation.items() if k != 'claim'}
+        result = validator.validate_citation(incomplete)
+        assert result['valid'] == False
+        assert 'claim' in result['missing_fields']
 
 # Run tests with: pytest tests/test_agents.py -v
\ No newline at end of file
@@ -1,44 +1,107 @@
 # Anthropic API Client for Agent Communication 
 
-import os 
-from anthropic import Anthropic
+import asyncio
+import os
+import uuid
+from anthropic import AsyncAnthropic
 import logging
 from typing import List, Dict, Any 
 from dotenv import load_dotenv
 
+from utils.llm_cache import LLMCache
+
 load_dotenv()
 
+# Shared preamble agents can pass as cached_system so Anthropic's prompt
+# cache reuses the prefix across all ten agents within its TTL
+SHARED_ADAS_SYSTEM_PROMPT = (
+    "You are part of a multi-agent system mapping semiconductor opportunities "
+    "in the US ADAS market. Ground every claim in verifiable sources, cite "
+    "URLs from reputable academic, financial or industry domains, state "
+    "confidence levels honestly, and respond with valid JSON matching the "
+    "schema you are given."
+)
+
 class AnthropicClient: 
     # Wrapper for Anthropic API calls 
 
-    def __init__(self): 
+    def __init__(self, cache: bool = False): 
         api_key=os.getenv('ANTHROPIC_API_KEY')
         if not api_key: 
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
 
-        self.client = Anthropic(api_key=api_key)
+        # AsyncAnthropic shares one pooled HTTP client, so concurrent
+        # agents genuinely overlap their LLM round-trips instead of
+        # blocking the event loop on the sync SDK
+        self.client = AsyncAnthropic(api_key=api_key, max_retries=3)
         self.model = os.getenv('ANTHROPIC_MODEL')
         self.logger = logging.getLogger('AnthropicClient')
+        # Optional exact-match response cache for repeated prompts
+        self._cache = LLMCache() if cache else None
+        # Scheduled runs don't care about latency; the Batches API is
+        # half the token cost of real-time messages.create
+        self._use_batch = os.getenv('ADAS_USE_BATCH_API') == '1'
+
+    @staticmethod
+    def _build_system(system_prompt: str, cached_system: str):
+        # Mark the shared prefix as an ephemeral cache block; cache hits
+        # bill ~10% of input cost for that prefix
+        if cached_system:
+            blocks = [{
+                "type": "text",
+                "text": cached_system,
+                "cache_control": {"type": "ephemeral"}
+            }]
+            if system_prompt:
+                blocks.append({"type": "text", "text": system_prompt})
+            return blocks
+        return system_prompt if system_prompt else None
 
     async def send_message(
         self, 
         prompt: str,
         system_prompt: str = "",
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cached_system: str = ""
     )  -> str: 
         # Try to send a message to Claude and get a response back
 
         try:
+            if self._cache is not None:
+                cache_key = LLMCache.make_key(self.model, cached_system + system_prompt, prompt, max_tokens)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self.logger.info("LLM cache hit; skipping API call")
+                    return cached
+
             messages = [{"role":"user", "content" : prompt}]
 
-            response = self.client.messages.create(
-                model = self.model,
-                max_tokens = max_tokens,
-                system = system_prompt if system_prompt else None, 
-                messages = messages
-            )
+            system = self._build_system(system_prompt, cached_system)
 
-            return response.content[0].text
+            if self._use_batch:
+                params = {
+                    "model": self.model,
+                    "max_tokens": max_tokens,
+                    "messages": messages
+                }
+                if system is not None:
+                    params["system"] = system
+                custom_id = uuid.uuid4().hex
+                results = await self.send_batch([{"custom_id": custom_id, "params": params}])
+                text = results[custom_id]
+                if text is None:
+                    raise RuntimeError("Batch API request did not succeed")
+            else:
+                response = await self.client.messages.create(
+                    model = self.model,
+                    max_tokens = max_tokens,
+                    system = system, 
+                    messages = messages
+                )
+                text = response.content[0].text
+            if self._cache is not None:
+                self._cache.put(cache_key, text)
+            return text
         
         except Exception as e: 
             self.logger.error(f"API call failed: {str(e)}")
@@ -48,15 +111,16 @@ class AnthropicClient:
         self, 
         prompt: str, 
         tools: List[Dict[str, Any]],
-        system_prompt: str = ""
+        system_prompt: str = "",
+        cached_system: str = ""
     ) -> Dict[str, Any]:
         # Sending message with tool use capability 
 
         try:
-            response=self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens = 4096,
-                system = system_prompt if system_prompt else None, 
+                system = self._build_system(system_prompt, cached_system), 
                 messages=[{"role":"user","content":prompt}],
                 tools=tools
             )
@@ -65,4 +129,30 @@ class AnthropicClient:
 
         except Exception as e:
             self.logger.error(f"Tool-enabled API call failed: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def send_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # Submit requests through the Message Batches API (50% cheaper),
+        # poll until the batch ends, and map custom_id -> response text
+        # (None for requests that did not succeed)
+
+        batch = await self.client.messages.batches.create(requests=requests)
+        self.logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(10)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                self.logger.error(f"Batch request {entry.custom_id} ended as {entry.result.type}")
+                results[entry.custom_id] = None
+
+        return results
+
+    async def aclose(self):
+        # Release the underlying HTTP connection pool
+        await self.client.close()
\ No newline at end of file
@@ -14,6 +14,7 @@ class ArchiveManager:
         self.viz_dir = self.outputs_dir / "visualizations"
         self.archives_dir = self.outputs_dir / "archives"
         self.logger = logging.getLogger('ArchiveManager')
+        self._cached_archives = None
         
         # Ensure directories exist
         self.reports_dir.mkdir(parents=True, exist_ok=True)
@@ -77,6 +78,7 @@ class ArchiveManager:
         
         if len(archive_runs) <= keep_last_n:
             self.logger.info(f"Have {len(archive_runs)} archives, keeping all (limit: {keep_last_n})")
+            self._cached_archives = [archive.name for archive in archive_runs]
             return
         
         # Delete old archives
@@ -86,11 +88,16 @@ class ArchiveManager:
             self.logger.info(f"Deleted old archive: {old_archive.name}")
         
         self.logger.info(f"Cleaned archives: kept {keep_last_n} most recent runs")
+        self._cached_archives = [archive.name for archive in archive_runs[-keep_last_n:]]
     
     def list_archives(self):
-        """List all archived runs."""
+        """List all archived runs (cached after clean_old_archives)."""
+        if self._cached_archives is not None:
+            return self._cached_archives
+        
         archives = sorted(self.archives_dir.glob("run_*"))
-        return [archive.name for archive in archives]
+        self._cached_archives = [archive.name for archive in archives]
+        return self._cached_archives
     
     def get_archive_info(self, archive_name: str):
         """Get information about a specific archive."""
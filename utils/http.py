@@ -0,0 +1,22 @@
+"""Shared HTTP client configuration for direct API access."""
+
+import httpx
+
+USPTO_BASE_URL = "https://developer.uspto.gov/ibd-api/v1"
+
+
+def get_uspto_client() -> httpx.AsyncClient:
+    """Build a USPTO client for one batch of concurrent requests.
+
+    The caller owns the lifecycle (use ``async with``): clients must
+    not outlive the event loop they first send on, so each
+    ``asyncio.run`` gets a fresh client rather than sharing pooled
+    connections across loops. Within a batch, HTTP/2 still multiplexes
+    every gathered request over one connection.
+    """
+    return httpx.AsyncClient(
+        base_url=USPTO_BASE_URL,
+        http2=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        timeout=30.0
+    )
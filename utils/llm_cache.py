@@ -0,0 +1,39 @@
+"""Exact-match disk cache for LLM responses."""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger('LLMCache')
+
+
+class LLMCache:
+    """Persists Claude responses keyed by a hash of the full request.
+
+    A hit skips the API round-trip and token spend entirely, which pays
+    off on scheduled reruns where many agent prompts repeat verbatim.
+    """
+
+    def __init__(self, cache_dir: str = '.cache/llm'):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Hash everything that influences the response."""
+        payload = f"{model}\x00{system_prompt}\x00{prompt}\x00{max_tokens}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        cache_file = self.cache_dir / f"{key}.txt"
+        try:
+            return cache_file.read_text()
+        except OSError:
+            return None
+
+    def put(self, key: str, response_text: str):
+        try:
+            (self.cache_dir / f"{key}.txt").write_text(response_text)
+        except OSError as e:
+            logger.warning(f"Could not write LLM cache entry: {e}")
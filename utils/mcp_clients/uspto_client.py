@@ -2,11 +2,110 @@
 """
 Direct USPTO API Client (no MCP server needed)
 """
+import asyncio
+import atexit
+import hashlib
+import time
+
 import httpx
 import logging
-from typing import List, Dict, Optional
+import orjson
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+from tenacity import (AsyncRetrying, retry, retry_if_result,
+                      stop_after_attempt, wait_exponential_jitter)
+
+# USPTO search results are effectively immutable over short windows, so
+# cached responses are served for a few hours before re-fetching.
+_CACHE_TTL_SECONDS = 6 * 3600
+
+# Fan-out width for concurrent USPTO requests; cooperates with the
+# token bucket so bursts stay inside the posted rate limit
+_MAX_PARALLEL_REQUESTS = 8
+
+# Statuses worth retrying: rate limiting and transient server errors
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _parse_doc(doc: Dict) -> Dict:
+    """Map one raw USPTO doc to the result schema.
+    
+    The single bound .get and one abstractText lookup keep the per-doc
+    opcount low; this runs once per returned row.
+    """
+    g = doc.get
+    abstract = g('abstractText')
+    return {
+        'patent_number': g('patentApplicationNumber', 'N/A'),
+        'title': g('inventionTitle', 'N/A'),
+        'assignee': g('assigneeEntityName', 'N/A'),
+        'filing_date': g('filingDate', 'N/A'),
+        'abstract': abstract[0] if abstract else 'N/A',
+        'inventors': g('firstNamedApplicant', 'N/A')
+    }
+
+
+def _retry_wait(retry_state) -> float:
+    """Honor Retry-After when the server sent one, else backoff + jitter."""
+    outcome = retry_state.outcome
+    if outcome is not None and not outcome.failed:
+        retry_after = outcome.result().headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after)
+    return wait_exponential_jitter(initial=0.5, max=30)(retry_state)
+
+
+# Retry on 429/5xx up to 5 attempts; after that hand back the last
+# response so callers see the real status instead of a RetryError
+_RETRY_KWARGS = dict(
+    retry=retry_if_result(lambda r: r.status_code in _RETRY_STATUS),
+    wait=_retry_wait,
+    stop=stop_after_attempt(5),
+    retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+)
+
+
+class _TokenBucket:
+    """Client-side rate limiter smoothing bursts to the USPTO API.
+    
+    Tokens may go negative: a caller reserves its token immediately and
+    sleeps off the debt, so concurrent callers each get a distinct
+    scheduled slot instead of stampeding when the bucket refills.
+    """
+    
+    def __init__(self, capacity: int, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+    
+    def _reserve(self, n: int) -> float:
+        """Take n tokens and return how long to wait for them."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.last_refill) * self.refill_per_sec
+        )
+        self.last_refill = now
+        self.tokens -= n
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_per_sec
+    
+    def acquire(self, n: int = 1) -> None:
+        delay = self._reserve(n)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self, n: int = 1) -> None:
+        delay = self._reserve(n)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class USPTOClient:
     """Direct USPTO Patent API client"""
     
@@ -14,6 +113,101 @@ class USPTOClient:
         self.base_url = "https://developer.uspto.gov/ibd-api/v1"
         self.logger = logging.getLogger('USPTOClient')
         self.timeout = 30.0
+        # Long-lived pooled client: every call hits the same host, so
+        # keep-alive amortizes the TLS handshake over all requests
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        )
+        self._cache_dir = Path('.cache/uspto-client')
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._bucket = _TokenBucket(capacity=10, refill_per_sec=5)
+        # In-memory layer over the disk cache, bound per instance so
+        # cached responses die with the client
+        self._cached_get = lru_cache(maxsize=1024)(self._get_uncached)
+    
+    def _cache_path(self, params: Tuple) -> Path:
+        digest = hashlib.sha256(repr(params).encode()).hexdigest()
+        return self._cache_dir / f"{digest}.json"
+    
+    def _cache_read(self, params: Tuple) -> Optional[Dict]:
+        """Return the cached response for params, or None if missing/stale."""
+        path = self._cache_path(params)
+        try:
+            if time.time() - path.stat().st_mtime < _CACHE_TTL_SECONDS:
+                return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            pass
+        return None
+    
+    def _cache_write(self, params: Tuple, data: Dict) -> None:
+        try:
+            self._cache_path(params).write_bytes(orjson.dumps(data))
+        except OSError:
+            pass  # Cache is best-effort; never fail the request over it
+    
+    @retry(**_RETRY_KWARGS)
+    def _send(self, params: Tuple) -> httpx.Response:
+        """One rate-limited GET attempt; tenacity retries 429/5xx."""
+        self._bucket.acquire()
+        return self._client.get("/patent/application", params=dict(params))
+    
+    async def _send_async(self, client: httpx.AsyncClient, params: Dict) -> httpx.Response:
+        async def _attempt() -> httpx.Response:
+            await self._bucket.acquire_async()
+            return await client.get("/patent/application", params=params)
+        
+        return await AsyncRetrying(**_RETRY_KWARGS)(_attempt)
+    
+    def _get_uncached(self, params: Tuple) -> Dict:
+        """Disk -> network for one GET; lru_cache wraps this in memory."""
+        cached = self._cache_read(params)
+        if cached is not None:
+            return cached
+        response = self._send(params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        self._cache_write(params, data)
+        return data
+    
+    def close(self):
+        """Release pooled connections."""
+        self._client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+    
+    def _search_data(self, query: str, rows: int,
+                     companies: Optional[List[str]]) -> Dict:
+        """Fetch the raw search response (memory -> disk -> network)."""
+        search_query = query
+        if companies:
+            company_filter = " OR ".join([f'assigneeEntityName:"{c}"' for c in companies])
+            search_query = f"{query} AND ({company_filter})"
+        
+        self.logger.info(f"Searching USPTO: {search_query}")
+        
+        return self._cached_get(tuple(sorted({
+            "searchText": search_query,
+            "rows": rows,
+            "sort": "filingDate desc"
+        }.items())))
+    
+    def iter_patents(self, query: str, rows: int = 10,
+                     companies: Optional[List[str]] = None):
+        """Yield parsed patents one at a time.
+        
+        Streaming form of search_patents: consumers that write rows out
+        or short-circuit early never hold the full parsed list. Request
+        errors propagate; search_patents keeps the error-dict contract.
+        """
+        for doc in self._search_data(query, rows, companies).get('docs', ()):
+            yield _parse_doc(doc)
     
     def search_patents(self, query: str, rows: int = 10, 
                        companies: Optional[List[str]] = None) -> Dict:
@@ -29,43 +223,14 @@ class USPTOClient:
             Dict with patent results
         """
         try:
-            # Build query
-            search_query = query
-            if companies:
-                company_filter = " OR ".join([f'assigneeEntityName:"{c}"' for c in companies])
-                search_query = f"{query} AND ({company_filter})"
-            
-            self.logger.info(f"Searching USPTO: {search_query}")
-            
-            # Make API call
-            response = httpx.get(
-                f"{self.base_url}/patent/application",
-                params={
-                    "searchText": search_query,
-                    "rows": rows,
-                    "sort": "filingDate desc"
-                },
-                timeout=self.timeout
-            )
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            # Parse results
-            patents = []
-            for doc in data.get('docs', []):
-                patents.append({
-                    'patent_number': doc.get('patentApplicationNumber', 'N/A'),
-                    'title': doc.get('inventionTitle', 'N/A'),
-                    'assignee': doc.get('assigneeEntityName', 'N/A'),
-                    'filing_date': doc.get('filingDate', 'N/A'),
-                    'abstract': doc.get('abstractText', ['N/A'])[0] if doc.get('abstractText') else 'N/A',
-                    'inventors': doc.get('firstNamedApplicant', 'N/A')
-                })
+            patents = list(self.iter_patents(query, rows, companies))
+            # Same cached response iter_patents just fetched, so this
+            # numFound lookup is an in-memory hit
+            total_found = self._search_data(query, rows, companies).get('numFound', 0)
             
             result = {
                 'query': query,
-                'total_found': data.get('numFound', 0),
+                'total_found': total_found,
                 'returned': len(patents),
                 'patents': patents
             }
@@ -83,11 +248,107 @@ class USPTOClient:
                 'error': str(e)
             }
     
+    async def _count_filings(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                             technology: str, company: str, year: int) -> Optional[int]:
+        """Count filings for one (company, year) cell of the trend grid."""
+        query = f'{technology} AND assigneeEntityName:"{company}" AND filingDate:[{year}-01-01 TO {year}-12-31]'
+        params = (("rows", 0), ("searchText", query))
+        cached = self._cache_read(params)
+        if cached is not None:
+            return cached.get('numFound', 0)
+        async with sem:
+            response = await self._send_async(client, {
+                "searchText": query,
+                "rows": 0  # Just get count
+            })
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            self._cache_write(params, data)
+            return data.get('numFound', 0)
+        self.logger.warning(f"USPTO count failed ({response.status_code}) for {company} {year}; skipping cell")
+        return None
+    
+    async def _company_year_counts(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                                   technology: str, company: str,
+                                   years: List[int]) -> Dict[int, int]:
+        """Per-year filing counts for one company via a single faceted query.
+        
+        One request spans the whole year range and lets the API bucket
+        filings by filingDate, so the trend grid costs O(companies)
+        round-trips instead of O(companies x years). Falls back to
+        per-year counting if the response carries no facet data.
+        """
+        query = f'{technology} AND assigneeEntityName:"{company}" AND filingDate:[{years[0]}-01-01 TO {years[-1]}-12-31]'
+        params = (
+            ("facet", "true"),
+            ("facet.range", "filingDate"),
+            ("facet.range.end", f"{years[-1] + 1}-01-01T00:00:00Z"),
+            ("facet.range.gap", "+1YEAR"),
+            ("facet.range.start", f"{years[0]}-01-01T00:00:00Z"),
+            ("rows", 0),
+            ("searchText", query),
+        )
+        data = self._cache_read(params)
+        if data is None:
+            async with sem:
+                response = await self._send_async(client, dict(params))
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                self._cache_write(params, data)
+        
+        if data is not None:
+            try:
+                # Solr-style flat list: [bucket_start, count, ...]
+                raw = data['facet_counts']['facet_ranges']['filingDate']['counts']
+                return {int(start[:4]): int(count)
+                        for start, count in zip(raw[::2], raw[1::2])}
+            except (KeyError, TypeError, ValueError, IndexError):
+                pass
+        
+        counts = await asyncio.gather(*(
+            self._count_filings(client, sem, technology, company, year)
+            for year in years
+        ))
+        return {year: count for year, count in zip(years, counts) if count is not None}
+    
+    async def _analyze_trends_async(self, technology: str, companies: List[str],
+                                    years: List[int]) -> Dict:
+        """Fetch per-company year counts concurrently, one request each."""
+        from utils.http import get_uspto_client
+        
+        sem = asyncio.Semaphore(_MAX_PARALLEL_REQUESTS)
+        async with get_uspto_client() as client:
+            per_company = await asyncio.gather(*(
+                self._company_year_counts(client, sem, technology, company, years)
+                for company in companies
+            ))
+        
+        by_company = {}
+        total_filings = 0
+        for company, year_counts in zip(companies, per_company):
+            company_patents = []
+            running_total = 0
+            for year in years:
+                if year in year_counts:
+                    count = year_counts[year]
+                    company_patents.append({'year': year, 'count': count})
+                    running_total += count
+            total_filings += running_total
+            by_company[company] = {
+                'total': running_total,
+                'by_year': company_patents
+            }
+        
+        return {'by_company': by_company, 'total_filings': total_filings}
+    
     def analyze_trends(self, technology: str, companies: List[str], 
                        years: List[int]) -> Dict:
         """
         Analyze patent filing trends over time
         
+        The (company, year) grid is fetched concurrently, so wall time is
+        roughly the slowest request instead of the sum of all of them.
+        
         Args:
             technology: Technology area to analyze
             companies: List of companies to track
@@ -99,42 +360,14 @@ class USPTOClient:
         try:
             self.logger.info(f"Analyzing trends for: {technology}")
             
-            by_company = {}
-            total_filings = 0
+            grid = asyncio.run(self._analyze_trends_async(technology, companies, years))
+            by_company = grid['by_company']
+            total_filings = grid['total_filings']
             
-            for company in companies:
-                company_patents = []
-                
-                for year in years:
-                    # Search by company and year
-                    query = f'{technology} AND assigneeEntityName:"{company}" AND filingDate:[{year}-01-01 TO {year}-12-31]'
-                    
-                    response = httpx.get(
-                        f"{self.base_url}/patent/application",
-                        params={
-                            "searchText": query,
-                            "rows": 0  # Just get count
-                        },
-                        timeout=self.timeout
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        count = data.get('numFound', 0)
-                        company_patents.append({
-                            'year': year,
-                            'count': count
-                        })
-                        total_filings += count
-                
-                by_company[company] = {
-                    'total': sum(p['count'] for p in company_patents),
-                    'by_year': company_patents
-                }
-            
-            # Calculate YoY growth
+            # Calculate YoY growth; needs two years and a populated
+            # series for every company or the endpoint indexing is moot
             yoy_growth = None
-            if len(years) >= 2:
+            if len(years) >= 2 and all(by_company[c]['by_year'] for c in companies):
                 earliest_year = years[0]
                 latest_year = years[-1]
                 
@@ -155,7 +388,7 @@ class USPTOClient:
                 'analysis_period': f"{min(years)}-{max(years)}",
                 'total_filings': total_filings,
                 'by_company': by_company,
-                'yoy_growth_percent': round(yoy_growth, 1) if yoy_growth else None,
+                'yoy_growth_percent': round(yoy_growth, 1) if yoy_growth is not None else None,
                 'insights': self._generate_insights(by_company, yoy_growth)
             }
             
@@ -171,11 +404,36 @@ class USPTOClient:
                 'error': str(e)
             }
     
+    async def _count_technologies(self, technology_areas: List[str]) -> List[Optional[int]]:
+        """Count patents per technology area concurrently."""
+        from utils.http import get_uspto_client
+        
+        sem = asyncio.Semaphore(_MAX_PARALLEL_REQUESTS)
+        
+        async def _count(client: httpx.AsyncClient, tech: str) -> Optional[int]:
+            params = (("rows", 0), ("searchText", tech))
+            cached = self._cache_read(params)
+            if cached is not None:
+                return cached.get('numFound', 0)
+            async with sem:
+                response = await self._send_async(client, {"searchText": tech, "rows": 0})
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                self._cache_write(params, data)
+                return data.get('numFound', 0)
+            self.logger.warning(f"USPTO count failed ({response.status_code}) for {tech}; skipping area")
+            return None
+        
+        async with get_uspto_client() as client:
+            return await asyncio.gather(*(_count(client, tech) for tech in technology_areas))
+    
     def find_white_space(self, technology_areas: List[str], 
                         threshold: int = 30) -> Dict:
         """
         Find emerging technologies with low patent competition
         
+        Counts for all technology areas are fetched concurrently.
+        
         Args:
             technology_areas: List of technology areas to check
             threshold: Patent count threshold for "white space"
@@ -186,34 +444,25 @@ class USPTOClient:
         try:
             self.logger.info(f"Analyzing {len(technology_areas)} technology areas")
             
+            counts = asyncio.run(self._count_technologies(technology_areas))
+            
             opportunities = []
             crowded_areas = []
             
-            for tech in technology_areas:
-                # Get patent count for this technology
-                response = httpx.get(
-                    f"{self.base_url}/patent/application",
-                    params={
-                        "searchText": tech,
-                        "rows": 0
-                    },
-                    timeout=self.timeout
-                )
+            for tech, patent_count in zip(technology_areas, counts):
+                if patent_count is None:
+                    continue
+                
+                entry = {
+                    'technology': tech,
+                    'patent_count': patent_count,
+                    'status': self._assess_competition(patent_count, threshold)
+                }
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    patent_count = data.get('numFound', 0)
-                    
-                    entry = {
-                        'technology': tech,
-                        'patent_count': patent_count,
-                        'status': self._assess_competition(patent_count, threshold)
-                    }
-                    
-                    if patent_count < threshold:
-                        opportunities.append(entry)
-                    else:
-                        crowded_areas.append(entry)
+                if patent_count < threshold:
+                    opportunities.append(entry)
+                else:
+                    crowded_areas.append(entry)
             
             result = {
                 'threshold': threshold,
@@ -255,8 +504,10 @@ class USPTOClient:
         
         return insights
     
-    def _assess_competition(self, patent_count: int, threshold: int) -> str:
-        """Assess competition level"""
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _assess_competition(patent_count: int, threshold: int) -> str:
+        """Assess competition level, memoized across repeated dashboard runs"""
         if patent_count < threshold * 0.5:
             return "Emerging - Low Competition"
         elif patent_count < threshold:
@@ -267,8 +518,15 @@ class USPTOClient:
             return "Mature - Very High Competition"
 
 
+@lru_cache(maxsize=1)
+def get_default_client() -> USPTOClient:
+    """Process-wide USPTOClient; pool and caches are built once."""
+    client = USPTOClient()
+    atexit.register(client.close)
+    return client
+
+
 # Quick search helper
 def quick_search(query: str, companies: Optional[List[str]] = None, rows: int = 10) -> Dict:
     """Quick patent search helper"""
-    client = USPTOClient()
-    return client.search_patents(query, rows, companies)
\ No newline at end of file
+    return get_default_client().search_patents(query, rows, companies)
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""Deterministic JSON serialization for prompt construction."""
+
+import json
+from datetime import datetime
+
+
+def canonical_json(obj, indent: int = 2) -> str:
+    """Serialize context data with stable key order for prompt embedding.
+
+    Dict iteration order and datetime reprs otherwise shift between runs,
+    changing the prompt prefix byte-for-byte and defeating Anthropic's
+    prompt cache.
+
+    Args:
+        obj: Data to serialize (context slices from previous agents)
+        indent: Indentation level, matching the json.dumps calls it replaces
+    """
+    return json.dumps(obj, indent=indent, sort_keys=True, default=_default)
+
+
+def _default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
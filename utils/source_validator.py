@@ -1,9 +1,30 @@
-# Source Validation and Credibility Checking
+"""Source validation and credibility checking.
+
+The module keeps precise type hints and avoids dynamic tricks so it
+stays mypyc-clean: for hot batch-validation workloads an optional
+compiled extension can be built with
+
+    pip install .[compiled]
+    mypyc utils/source_validator.py
+
+and Python will prefer the resulting .so over this file automatically.
+The pure-Python form remains the supported default.
+"""
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Tuple
+from urllib.parse import urlsplit
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup; regex + label walk still work
+    ahocorasick = None
+
 class SourceValidator: 
     # Validates sources against the criteria I set
 
@@ -13,7 +34,7 @@ class SourceValidator:
         #Financial/Market Research
         'jpmorgan.com', 'goldmansachs.com', 'morganstanley.com',
         #Industry
-        'ti.com', 'nxp.com', 'infineon.com', 'qualcomm.com', 'nvidia.com', 'intel.com', 'amd.com'
+        'ti.com', 'nxp.com', 'infineon.com', 'qualcomm.com', 'nvidia.com', 'intel.com', 'amd.com',
         #OEMS
         'tesla.com', 'gm.com', 'ford.com', 'rivian.com'
     ]
@@ -27,8 +48,40 @@ class SourceValidator:
         r'facebook\.com'
     ]
 
-    def __init__(self):
-        self.validation_log = []
+    # Compiled once at class load so validate_url does no per-call
+    # compile-cache lookups or list scans (batch path still uses this)
+    _EXCLUDED_RE = re.compile('|'.join(EXCLUDED_PATTERNS), re.IGNORECASE)
+    _ALLOWED = frozenset(ALLOWED_DOMAINS)
+
+    # EXCLUDED_PATTERNS split into their literal forms so the per-URL
+    # path needs no regex engine: host suffixes go through C-level
+    # endswith, the rest through substring scans
+    _EXCLUDED_HOST_SUFFIXES = ('medium.com', 'twitter.com', 'facebook.com')
+    _EXCLUDED_SUBSTRINGS = ('blog.', '/blog/', 'linkedin.com/pulse')
+
+    # Built once at class scope; deterministic order keeps
+    # missing_fields stable for callers and tests
+    _REQUIRED_FIELDS = ('source', 'url', 'date_accessed', 'claim')
+
+    def __init__(self) -> None:
+        self.validation_log: List[Dict[str, object]] = []
+        
+        # With pyahocorasick available, both lists are matched in one
+        # C-level pass over the URL (patterns are literal fragments, so
+        # the unescaped text is the pattern itself)
+        self._allowed_automaton = None
+        self._excluded_automaton = None
+        if ahocorasick is not None:
+            self._allowed_automaton = ahocorasick.Automaton()
+            for domain in self.ALLOWED_DOMAINS:
+                self._allowed_automaton.add_word(domain, domain)
+            self._allowed_automaton.make_automaton()
+            
+            self._excluded_automaton = ahocorasick.Automaton()
+            for pattern in self.EXCLUDED_PATTERNS:
+                literal = re.sub(r'\\(.)', r'\1', pattern)
+                self._excluded_automaton.add_word(literal, literal)
+            self._excluded_automaton.make_automaton()
 
     def validate_url(self, url: str) -> Tuple[bool, str]:
         """ Validate a single URL
@@ -37,36 +90,51 @@ class SourceValidator:
             (is_valid, reason)
         """
         # Check excluded patterns 
-        for pattern in self.EXCLUDED_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                return False, f"Matches excluded pattern: {pattern}"
+        lowered = url.lower()
+        host = urlsplit(lowered).hostname or ''
+        if self._excluded_automaton is not None:
+            for _, token in self._excluded_automaton.iter(lowered):
+                return False, f"Matches excluded pattern: {token}"
+        else:
+            if host.endswith(self._EXCLUDED_HOST_SUFFIXES):
+                suffix = next(s for s in self._EXCLUDED_HOST_SUFFIXES if host.endswith(s))
+                return False, f"Matches excluded pattern: {suffix}"
+            for token in self._EXCLUDED_SUBSTRINGS:
+                if token in lowered:
+                    return False, f"Matches excluded pattern: {token}"
+        
+        if self._allowed_automaton is not None:
+            # Accept only matches that end the host on a label boundary,
+            # so 'ti.com' can't fire inside 'multi.community'
+            for end, domain in self._allowed_automaton.iter(host):
+                start = end - len(domain) + 1
+                if end == len(host) - 1 and (start == 0 or host[start - 1] == '.'):
+                    return True, f"Matches allowed domain: {domain}"
+            return False, "Domain not allowed list"
         
-        # Check allowed domains
-        for domain in self.ALLOWED_DOMAINS:
-            if domain in url.lower():
-                return True, f"Matches allowed domain: {domain}"
+        # Walk host label suffixes: O(labels) instead of O(|ALLOWED_DOMAINS|)
+        parts = host.split('.')
+        for i in range(len(parts) - 1):
+            suffix = '.'.join(parts[i:])
+            if suffix in self._ALLOWED:
+                return True, f"Matches allowed domain: {suffix}"
 
         return False, "Domain not allowed list"
 
-    def validate_citation(self, citation: Dict) -> Dict:
+    def validate_citation(self, citation: Dict[str, str]) -> Dict[str, object]:
         """
         Validate a citation with required fields.
 
         Required fields: source, url, date_accessed, claim
         """
-        required_fields = ['source', 'url', 'date_accessed', 'claim ']
+        missing = [f for f in self._REQUIRED_FIELDS if not citation.get(f)]
 
         validation_result = {
-            'valid': True,
-            'missing_fields': [],
+            'valid': not missing,
+            'missing_fields': missing,
             'url_valid': True,
             'url_reason':''
         }
-
-        for field in required_fields:
-            if field not in citation or not citation[field]:
-                validation_result['valid'] = False 
-                validation_result['missing_fields'].append(field)
         
         if 'url' in citation: 
             url_valid, url_reason = self.validate_url(citation['url'])
@@ -78,8 +146,14 @@ class SourceValidator:
         
         return validation_result
 
-    def validate_batch(self, citations: List[Dict]) -> Dict:
-        """Validate multiple citations and return summary"""
+    def validate_batch(self, citations: List[Dict[str, str]]) -> Dict[str, object]:
+        """Validate multiple citations and return summary.
+
+        The field and URL checks run as vectorized masks over the whole
+        batch; per-citation details are assembled from the mask columns,
+        so large citation lists avoid one validate_citation call each.
+        URL reasons are coarser than validate_url's (no matched token).
+        """
 
         results = {
             'total': len(citations),
@@ -87,9 +161,46 @@ class SourceValidator:
             'invalid': 0,
             'details': []
         }
+        if not citations:
+            return results
 
-        for citation in citations: 
-            result = self.validate_citation(citation)
+        required_fields = list(self._REQUIRED_FIELDS)
+        df = pd.DataFrame(citations)
+        for field in required_fields:
+            if field not in df.columns:
+                df[field] = None
+
+        present = (df[required_fields].notna() & (df[required_fields] != '')).to_numpy()
+        has_url = df['url'].notna().to_numpy()
+
+        urls = df['url'].fillna('').astype(str)
+        # One finditer pass over a sentinel-joined blob instead of one
+        # regex call per row; match positions map back to row indices
+        # by counting separators (matches are rare, so the counts are
+        # cheap). Patterns are literals and can't span the sentinel.
+        joined = '\x1f'.join(urls)
+        excluded = np.zeros(len(df), dtype=bool)
+        for match in self._EXCLUDED_RE.finditer(joined):
+            excluded[joined.count('\x1f', 0, match.start())] = True
+        host = urls.str.extract(r'://([^/:?#]+)', expand=False).fillna('').str.lower()
+        # Exact host or dot-separated suffix, matching validate_url's
+        # label-boundary semantics ('multi.com' must not hit 'ti.com')
+        allowed = (host.isin(self._ALLOWED)
+                   | host.str.endswith(tuple('.' + d for d in self._ALLOWED))).to_numpy()
+
+        url_valid = ~excluded & allowed
+        url_reason = np.where(
+            excluded, 'Matches excluded pattern',
+            np.where(allowed, 'Matches allowed domain', 'Domain not allowed list'))
+
+        for i in range(len(df)):
+            missing = [f for f, ok in zip(required_fields, present[i]) if not ok]
+            result = {
+                'valid': not missing and (not has_url[i] or bool(url_valid[i])),
+                'missing_fields': missing,
+                'url_valid': bool(url_valid[i]) if has_url[i] else True,
+                'url_reason': str(url_reason[i]) if has_url[i] else ''
+            }
             results['details'].append(result)
 
             if result['valid']:
@@ -99,3 +210,8 @@ class SourceValidator:
 
         return results
 
+
+@lru_cache(maxsize=1)
+def get_default_validator() -> "SourceValidator":
+    """Process-wide SourceValidator; automata are built once."""
+    return SourceValidator()